@@ -20,6 +20,8 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # All DDL stays on the migration connection: Postgres DDL is transactional, so a
+    # failure here rolls back the whole schema instead of leaving tables half-created.
     op.create_table(
         "users",
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
@@ -33,7 +35,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("username"),
     )
-    op.create_index("ix_users_id", "users", ["id"], unique=False)
 
     op.create_table(
         "categories",
@@ -78,7 +79,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["locked_by_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_texts_external_id", "texts", ["external_id"], unique=False)
 
     op.create_table(
         "annotation_tasks",
@@ -191,9 +191,7 @@ def downgrade() -> None:
     op.drop_table("skipped_texts")
     op.drop_table("user_error_types")
     op.drop_table("annotation_tasks")
-    op.drop_index("ix_texts_external_id", table_name="texts")
     op.drop_table("texts")
     op.drop_table("error_types")
     op.drop_table("categories")
-    op.drop_index("ix_users_id", table_name="users")
     op.drop_table("users")
@@ -7,6 +7,8 @@ Create Date: 2024-09-03 00:00:00.000000
 
 from __future__ import annotations
 
+from typing import NamedTuple
+
 from alembic import op
 import sqlalchemy as sa
 
@@ -177,6 +179,24 @@ COLOR_BY_CATEGORY = {
 }
 
 
+class _SeedRow(NamedTuple):
+    category_en: str
+    category_tt: str
+    en_name: str
+    tt_name: str
+    description: str
+    default_color: str
+    default_hotkey: str | None = None
+    is_active: bool = True
+
+
+_SEED_COLUMNS = list(_SeedRow._fields)
+_SEED_ROWS = tuple(
+    _SeedRow(**entry, default_color=COLOR_BY_CATEGORY.get(entry["category_en"], "#f97316"))
+    for entry in TAXONOMY
+)
+
+
 def upgrade() -> None:
     error_types = sa.table(
         "error_types",
@@ -191,28 +211,48 @@ def upgrade() -> None:
         sa.column("tt_name", sa.String()),
     )
 
-    conn = op.get_bind()
-    existing = {
-        (row.en_name, row.tt_name): row
-        for row in conn.execute(sa.select(error_types.c.en_name, error_types.c.tt_name, error_types.c.id))
-    }
-
-    for entry in TAXONOMY:
-        data = {
-            **entry,
-            "default_color": COLOR_BY_CATEGORY.get(entry["category_en"], "#f97316"),
-            "default_hotkey": None,
-            "is_active": True,
-        }
-        key = (entry.get("en_name"), entry.get("tt_name"))
-        if key in existing:
-            conn.execute(
-                error_types.update()
-                .where(error_types.c.id == existing[key].id)
-                .values(**data)
+    seed_columns = _SEED_COLUMNS
+    seed_rows = list(_SEED_ROWS)
+    bind = op.get_bind()
+
+    # A fresh table is filled with COPY in one streamed message; the upsert below is only
+    # needed when some of the rows already exist.
+    if bind.dialect.driver == "psycopg" and not bind.execute(
+        sa.select(sa.func.count()).select_from(error_types)
+    ).scalar():
+        copy_sql = f"COPY error_types ({', '.join(seed_columns)}) FROM STDIN"
+        with bind.connection.driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+            for row in seed_rows:
+                copy.write_row(row)
+        return
+
+    seed = sa.select(
+        sa.values(
+            *(sa.column(name, error_types.c[name].type) for name in seed_columns),
+            name="seed_values",
+        ).data(seed_rows)
+    ).cte("seed")
+
+    # Upsert in a single round trip: refresh rows that already exist (matched by their
+    # en/tt name pair, which has no unique constraint to target with ON CONFLICT) and
+    # insert the rest.
+    updated = (
+        error_types.update()
+        .where(error_types.c.en_name == seed.c.en_name, error_types.c.tt_name == seed.c.tt_name)
+        .values({name: seed.c[name] for name in seed_columns})
+        .returning(error_types.c.en_name, error_types.c.tt_name)
+        .cte("updated")
+    )
+    stmt = error_types.insert().from_select(
+        seed_columns,
+        sa.select(*(seed.c[name] for name in seed_columns)).where(
+            ~sa.exists().where(
+                updated.c.en_name == seed.c.en_name,
+                updated.c.tt_name == seed.c.tt_name,
             )
-        else:
-            conn.execute(error_types.insert().values(**data))
+        ),
+    )
+    bind.execute(stmt)
 
 
 def downgrade() -> None:
@@ -221,10 +261,14 @@ def downgrade() -> None:
         sa.column("en_name", sa.String()),
         sa.column("tt_name", sa.String()),
     )
+    seeded = sa.values(
+        sa.column("en_name", sa.String()),
+        sa.column("tt_name", sa.String()),
+        name="seeded",
+    ).data([(row.en_name, row.tt_name) for row in _SEED_ROWS])
     op.execute(
         error_types.delete().where(
-            sa.tuple_(error_types.c.en_name, error_types.c.tt_name).in_(
-                [(entry.get("en_name"), entry.get("tt_name")) for entry in TAXONOMY]
-            )
+            error_types.c.en_name == seeded.c.en_name,
+            error_types.c.tt_name == seeded.c.tt_name,
         )
     )
@@ -8,7 +8,6 @@ Create Date: 2024-09-03 00:00:01.000000
 from __future__ import annotations
 
 from alembic import op
-import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = "20240903_03_widen_hotkey_length"
@@ -18,13 +17,18 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Allow longer revision identifiers and hotkeys
-    op.alter_column("alembic_version", "version_num", type_=sa.String(length=64))
-    op.alter_column("error_types", "default_hotkey", type_=sa.Text())
-    op.alter_column("user_error_types", "hotkey", type_=sa.Text())
+    # Allow longer revision identifiers and hotkeys. Each ALTER targets a different table,
+    # so they are sent together in one round trip rather than merged into one statement.
+    op.execute(
+        "ALTER TABLE alembic_version ALTER COLUMN version_num TYPE VARCHAR(64);"
+        " ALTER TABLE error_types ALTER COLUMN default_hotkey TYPE TEXT;"
+        " ALTER TABLE user_error_types ALTER COLUMN hotkey TYPE TEXT"
+    )
 
 
 def downgrade() -> None:
-    op.alter_column("error_types", "default_hotkey", type_=sa.String(length=8))
-    op.alter_column("user_error_types", "hotkey", type_=sa.String(length=8))
-    op.alter_column("alembic_version", "version_num", type_=sa.String(length=32))
+    op.execute(
+        "ALTER TABLE error_types ALTER COLUMN default_hotkey TYPE VARCHAR(8);"
+        " ALTER TABLE user_error_types ALTER COLUMN hotkey TYPE VARCHAR(8);"
+        " ALTER TABLE alembic_version ALTER COLUMN version_num TYPE VARCHAR(32)"
+    )
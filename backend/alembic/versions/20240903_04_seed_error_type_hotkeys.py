@@ -17,49 +17,53 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
-    HOTKEYS = {
-        # Fluency (Shift+number)
-        "Calque": "shift+1",
-        "CodeSwitch": "shift+2",
-        "Collocation": "shift+3",
-        "Paronym": "shift+4",
-        "Pleonasm": "shift+5",
-        "Style": "shift+6",
-        "WordChoice": "shift+7",
-        # Grammar (Shift+QWERTY row)
-        "Agreement": "shift+q",
-        "Case": "shift+w",
-        "Hyphen": "shift+e",
-        "Merge": "shift+r",
-        "Particle": "shift+t",
-        "Possessive": "shift+y",
-        "Split": "shift+u",
-        "VerbTense": "shift+i",
-        "VerbVoice": "shift+o",
-        "WordOrder": "shift+p",
-        # Word errors (Shift+ASD...)
-        "Dialect": "shift+a",
-        "Script": "shift+s",
-        "Spelling": "shift+d",
-        # Punctuation (Shift+Z)
-        "Punctuation": "shift+z",
-    }
+HOTKEYS = {
+    # Fluency (Shift+number)
+    "Calque": "shift+1",
+    "CodeSwitch": "shift+2",
+    "Collocation": "shift+3",
+    "Paronym": "shift+4",
+    "Pleonasm": "shift+5",
+    "Style": "shift+6",
+    "WordChoice": "shift+7",
+    # Grammar (Shift+QWERTY row)
+    "Agreement": "shift+q",
+    "Case": "shift+w",
+    "Hyphen": "shift+e",
+    "Merge": "shift+r",
+    "Particle": "shift+t",
+    "Possessive": "shift+y",
+    "Split": "shift+u",
+    "VerbTense": "shift+i",
+    "VerbVoice": "shift+o",
+    "WordOrder": "shift+p",
+    # Word errors (Shift+ASD...)
+    "Dialect": "shift+a",
+    "Script": "shift+s",
+    "Spelling": "shift+d",
+    # Punctuation (Shift+Z)
+    "Punctuation": "shift+z",
+}
+
 
+def upgrade() -> None:
     error_types = sa.table(
         "error_types",
         sa.column("id", sa.Integer()),
         sa.column("en_name", sa.String()),
         sa.column("default_hotkey", sa.String()),
     )
+    hotkeys = sa.values(
+        sa.column("en_name", sa.String()),
+        sa.column("hotkey", sa.String()),
+        name="hotkeys",
+    ).data(list(HOTKEYS.items()))
 
-    conn = op.get_bind()
-    for en_name, hotkey in HOTKEYS.items():
-        conn.execute(
-            error_types.update()
-            .where(error_types.c.en_name == en_name)
-            .values(default_hotkey=hotkey)
-        )
+    op.get_bind().execute(
+        error_types.update()
+        .where(error_types.c.en_name == hotkeys.c.en_name)
+        .values(default_hotkey=hotkeys.c.hotkey)
+    )
 
 
 def downgrade() -> None:
@@ -68,32 +72,8 @@ def downgrade() -> None:
         sa.column("en_name", sa.String()),
         sa.column("default_hotkey", sa.String()),
     )
-    conn = op.get_bind()
-    for en_name in [
-        "Calque",
-        "CodeSwitch",
-        "Collocation",
-        "Paronym",
-        "Pleonasm",
-        "Style",
-        "WordChoice",
-        "Agreement",
-        "Case",
-        "Hyphen",
-        "Merge",
-        "Particle",
-        "Possessive",
-        "Split",
-        "VerbTense",
-        "VerbVoice",
-        "WordOrder",
-        "Dialect",
-        "Script",
-        "Spelling",
-        "Punctuation",
-    ]:
-        conn.execute(
-            error_types.update()
-            .where(error_types.c.en_name == en_name)
-            .values(default_hotkey=None)
-        )
+    op.get_bind().execute(
+        error_types.update()
+        .where(error_types.c.en_name.in_(list(HOTKEYS)))
+        .values(default_hotkey=None)
+    )
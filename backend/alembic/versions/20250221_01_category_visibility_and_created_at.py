@@ -1,4 +1,4 @@
-"""Add category visibility and created_at
+"""Add category visibility and created_at, drop unused audit_logs table
 
 Revision ID: 20250221_01_category_visibility_and_created_at
 Revises: 20240903_04_seed_error_type_hotkeys
@@ -10,6 +10,7 @@ from __future__ import annotations
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -37,6 +38,9 @@ def upgrade() -> None:
             sa.Column("is_hidden", sa.Boolean(), server_default=sa.text("false"), nullable=False),
         )
 
+    if inspector.has_table("audit_logs"):
+        op.drop_table("audit_logs")
+
 
 def downgrade() -> None:
     bind = op.get_bind()
@@ -47,3 +51,16 @@ def downgrade() -> None:
         op.drop_column("categories", "is_hidden")
     if "created_at" in columns:
         op.drop_column("categories", "created_at")
+
+    if not inspector.has_table("audit_logs"):
+        op.create_table(
+            "audit_logs",
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("actor_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+            sa.Column("action", sa.String(length=64), nullable=False),
+            sa.Column("entity", sa.String(length=64), nullable=False),
+            sa.Column("entity_id", sa.String(length=64), nullable=False),
+            sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+        )
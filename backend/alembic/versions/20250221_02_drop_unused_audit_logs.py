@@ -8,9 +8,7 @@ Create Date: 2025-02-21 00:15:00.000000
 from __future__ import annotations
 
 from alembic import op
-import sqlalchemy as sa
 from sqlalchemy import inspect
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = "20250221_02_drop_unused_audit_logs"
@@ -20,26 +18,12 @@ depends_on = None
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    if "audit_logs" in inspector.get_table_names():
+    # The drop now happens in 20250221_01; this revision only catches databases that
+    # were upgraded to 20250221_01 before the two were folded together.
+    if inspect(op.get_bind()).has_table("audit_logs"):
         op.drop_table("audit_logs")
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    if "audit_logs" in inspector.get_table_names():
-        return
-
-    op.create_table(
-        "audit_logs",
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
-        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
-        sa.Column("actor_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
-        sa.Column("action", sa.String(length=64), nullable=False),
-        sa.Column("entity", sa.String(length=64), nullable=False),
-        sa.Column("entity_id", sa.String(length=64), nullable=False),
-        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
-    )
+    # 20250221_01's downgrade restores audit_logs.
+    pass
@@ -7,11 +7,17 @@ Create Date: 2025-03-07 00:00:00.000000
 
 from __future__ import annotations
 
+import hashlib
 import json
 
 from alembic import op
 import sqlalchemy as sa
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # revision identifiers, used by Alembic.
 revision = "20250307_01_dedupe_annotations"
 down_revision = "20250221_02_drop_unused_audit_logs"
@@ -19,33 +25,67 @@ branch_labels = None
 depends_on = None
 
 
-def _payload_key(value: object) -> str:
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# Most annotations carry the default empty payload, so its key is computed once.
+_EMPTY_PAYLOAD_KEY = _digest(b"{}")
+
+
+def _canonical_key(value: object) -> bytes:
+    if orjson is not None:
+        try:
+            return _digest(orjson.dumps(value, option=orjson.OPT_SORT_KEYS))
+        except TypeError:
+            # orjson rejects what it cannot encode (e.g. ints over 64 bits); json.dumps can.
+            pass
+    try:
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        text = str(value)
+    return _digest(text.encode("utf-8"))
+
+
+def _payload_key(value: object) -> bytes:
+    # Only a 128-bit digest of the canonical JSON is kept in the seen set, so memory no
+    # longer grows with payload size. Drivers hand back plain dict (JSONB) or str (JSON as
+    # text) payloads, so those exact types return before any isinstance checks.
+    kind = type(value)
+    if kind is dict:
+        return _canonical_key(value) if value else _EMPTY_PAYLOAD_KEY
+    if kind is str:
+        return _EMPTY_PAYLOAD_KEY if value == "{}" else _digest(value.encode("utf-8"))
+    if isinstance(value, dict) and not value:
+        return _EMPTY_PAYLOAD_KEY
     if isinstance(value, str):
-        return value
+        return _EMPTY_PAYLOAD_KEY if value == "{}" else _digest(value.encode("utf-8"))
     if isinstance(value, (bytes, bytearray)):
         try:
-            return value.decode("utf-8")
-        except Exception:
-            return repr(value)
-    try:
-        return json.dumps(value, sort_keys=True, separators=(",", ":"))
-    except Exception:
-        return str(value)
+            value.decode("utf-8")
+        except UnicodeDecodeError:
+            return _digest(repr(value).encode("utf-8"))
+        return _digest(bytes(value))
+    return _canonical_key(value)
 
 
 def _delete_ids(bind, ids: list[int]) -> None:
     if not ids:
         return
-    stmt = sa.text("DELETE FROM annotations WHERE id IN :ids").bindparams(
-        sa.bindparam("ids", expanding=True)
-    )
-    chunk_size = 500
+    if bind.dialect.name == "postgresql":
+        # A single array parameter keeps one cached plan regardless of how many ids there are.
+        stmt = sa.text("DELETE FROM annotations WHERE id = ANY(CAST(:ids AS integer[]))")
+        chunk_size = 1_000_000
+    else:
+        stmt = sa.text("DELETE FROM annotations WHERE id IN :ids").bindparams(
+            sa.bindparam("ids", expanding=True)
+        )
+        chunk_size = 500
     for idx in range(0, len(ids), chunk_size):
         bind.execute(stmt, {"ids": ids[idx : idx + chunk_size]})
 
 
-def upgrade() -> None:
-    bind = op.get_bind()
+def _dedupe_in_python(bind) -> None:
     rows = bind.execute(
         sa.text(
             "SELECT id, text_id, start_token, end_token, replacement, error_type_id, payload "
@@ -71,6 +111,32 @@ def upgrade() -> None:
     _delete_ids(bind, duplicates)
 
 
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        _dedupe_in_python(bind)
+        return
+    # Group on the dedupe key with a transient expression index backing the scan. Payloads
+    # are compared through a fixed-size md5 of their JSONB text form, which is canonical
+    # (key order does not matter), matching the key used by the Python fallback. GROUP BY
+    # treats NULL replacements as equal. The lowest id of each group is kept.
+    op.create_index(
+        "ix_annotations_dedupe",
+        "annotations",
+        ["text_id", "start_token", "end_token", "error_type_id", sa.text("md5(payload::text)")],
+    )
+    groups = bind.execute(
+        sa.text(
+            "SELECT array_agg(id ORDER BY id) FROM annotations "
+            "GROUP BY text_id, start_token, end_token, error_type_id, md5(payload::text), "
+            "replacement "
+            "HAVING count(*) > 1"
+        )
+    ).scalars()
+    _delete_ids(bind, [annotation_id for ids in groups for annotation_id in ids[1:]])
+    op.drop_index("ix_annotations_dedupe", table_name="annotations")
+
+
 def downgrade() -> None:
     # Data cleanup is not reversible.
     pass
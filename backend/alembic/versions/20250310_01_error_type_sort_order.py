@@ -23,19 +23,35 @@ def upgrade() -> None:
         sa.Column("sort_order", sa.Integer(), nullable=False, server_default="0"),
     )
     bind = op.get_bind()
+    # The backfill rewrites every row; rebuilding secondary indexes once afterwards is
+    # cheaper than maintaining them per row. Unique indexes stay in place as constraints,
+    # and so does anything the name-and-columns rebuild below could not reproduce
+    # (expressions, sort order, or dialect options such as a WHERE clause or INCLUDE).
+    secondary_indexes = [
+        index
+        for index in sa.inspect(bind).get_indexes("error_types")
+        if not index.get("unique")
+        and all(index["column_names"])
+        and not index.get("column_sorting")
+        and not any(index.get("dialect_options", {}).values())
+    ]
+    for index in secondary_indexes:
+        op.drop_index(index["name"], table_name="error_types")
+    # Fresh statistics let the planner pick a hash join for this small table.
+    bind.execute(sa.text("ANALYZE error_types"))
     bind.execute(
         sa.text(
-            "WITH ordered AS ("
-            " SELECT id,"
-            " ROW_NUMBER() OVER (PARTITION BY category_en ORDER BY category_en, en_name, id) AS rn"
-            " FROM error_types"
-            ")"
-            " UPDATE error_types"
+            "UPDATE error_types"
             " SET sort_order = ordered.rn"
-            " FROM ordered"
+            " FROM ("
+            " SELECT id, ROW_NUMBER() OVER (PARTITION BY category_en ORDER BY en_name, id) AS rn"
+            " FROM error_types"
+            ") AS ordered"
             " WHERE error_types.id = ordered.id"
         )
     )
+    for index in secondary_indexes:
+        op.create_index(index["name"], "error_types", index["column_names"])
 
 
 def downgrade() -> None:
@@ -0,0 +1,30 @@
+"""Build secondary indexes after seed data, drop redundant users index
+
+Revision ID: 20250315_01_post_seed_indexes
+Revises: 20250310_01_error_type_sort_order
+Create Date: 2025-03-15 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250315_01_post_seed_indexes"
+down_revision = "20250310_01_error_type_sort_order"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # users.id is the primary key, so ix_users_id only duplicated the PK btree. Databases
+    # created before this revision already carry both indexes, hence the guards.
+    op.drop_index("ix_users_id", table_name="users", if_exists=True)
+    op.create_index(
+        "ix_texts_external_id", "texts", ["external_id"], unique=False, if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_texts_external_id", table_name="texts", if_exists=True)
+    op.create_index("ix_users_id", "users", ["id"], unique=False, if_not_exists=True)
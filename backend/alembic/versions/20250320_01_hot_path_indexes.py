@@ -0,0 +1,38 @@
+"""Index annotation export ordering and per-category state counters
+
+Revision ID: 20250320_01_hot_path_indexes
+Revises: 20250315_01_post_seed_indexes
+Create Date: 2025-03-20 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250320_01_hot_path_indexes"
+down_revision = "20250315_01_post_seed_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_annotations_text_author_id",
+        "annotations",
+        ["text_id", "author_id", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_texts_category_state",
+        "texts",
+        ["category_id", "state"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_texts_category_state", table_name="texts", if_exists=True)
+    op.drop_index("ix_annotations_text_author_id", table_name="annotations", if_exists=True)
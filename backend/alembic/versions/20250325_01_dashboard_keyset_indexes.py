@@ -0,0 +1,40 @@
+"""Index dashboard list ordering for keyset pagination
+
+Revision ID: 20250325_01_dashboard_keyset_indexes
+Revises: 20250320_01_hot_path_indexes
+Create Date: 2025-03-25 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250325_01_dashboard_keyset_indexes"
+down_revision = "20250320_01_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_annotation_tasks_updated_at_id",
+        "annotation_tasks",
+        ["updated_at", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_skipped_texts_flag_type_created_at_id",
+        "skipped_texts",
+        ["flag_type", "created_at", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_skipped_texts_flag_type_created_at_id", table_name="skipped_texts", if_exists=True
+    )
+    op.drop_index("ix_annotation_tasks_updated_at_id", table_name="annotation_tasks", if_exists=True)
@@ -0,0 +1,43 @@
+"""Index dashboard status and annotator filters
+
+Revision ID: 20250328_01_dashboard_filter_indexes
+Revises: 20250325_01_dashboard_keyset_indexes
+Create Date: 2025-03-28 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250328_01_dashboard_filter_indexes"
+down_revision = "20250325_01_dashboard_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Ascending btrees serve the DESC orderings too (backward scan), so no DESC columns.
+    op.create_index(
+        "ix_annotation_tasks_status_updated_at_id",
+        "annotation_tasks",
+        ["status", "updated_at", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_skipped_texts_annotator_created_at",
+        "skipped_texts",
+        ["annotator_id", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_skipped_texts_annotator_created_at", table_name="skipped_texts", if_exists=True
+    )
+    op.drop_index(
+        "ix_annotation_tasks_status_updated_at_id", table_name="annotation_tasks", if_exists=True
+    )
@@ -0,0 +1,30 @@
+"""Index submitted tasks by text for completion counts
+
+Revision ID: 20250401_01_task_status_text_index
+Revises: 20250328_01_dashboard_filter_indexes
+Create Date: 2025-04-01 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250401_01_task_status_text_index"
+down_revision = "20250328_01_dashboard_filter_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_annotation_tasks_status_text_id",
+        "annotation_tasks",
+        ["status", "text_id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_annotation_tasks_status_text_id", table_name="annotation_tasks", if_exists=True)
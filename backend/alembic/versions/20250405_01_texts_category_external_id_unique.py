@@ -0,0 +1,30 @@
+"""Enforce unique external ids per category for idempotent imports
+
+Revision ID: 20250405_01_texts_category_external_id_unique
+Revises: 20250401_01_task_status_text_index
+Create Date: 2025-04-05 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250405_01_texts_category_external_id_unique"
+down_revision = "20250401_01_task_status_text_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uniq_text_external_id",
+        "texts",
+        ["category_id", "external_id"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uniq_text_external_id", table_name="texts", if_exists=True)
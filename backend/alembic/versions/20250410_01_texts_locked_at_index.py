@@ -0,0 +1,33 @@
+"""Partially index text locks for the expired-lock sweep
+
+Revision ID: 20250410_01_texts_locked_at_index
+Revises: 20250405_01_texts_category_external_id_unique
+Create Date: 2025-04-10 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250410_01_texts_locked_at_index"
+down_revision = "20250405_01_texts_category_external_id_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_texts_locked_at",
+        "texts",
+        ["locked_at"],
+        unique=False,
+        if_not_exists=True,
+        postgresql_where=sa.text("locked_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_texts_locked_at", table_name="texts", if_exists=True)
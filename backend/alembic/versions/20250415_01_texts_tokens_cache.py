@@ -0,0 +1,31 @@
+"""Store import-time tokenization on texts
+
+Revision ID: 20250415_01_texts_tokens_cache
+Revises: 20250410_01_texts_locked_at_index
+Create Date: 2025-04-15 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250415_01_texts_tokens_cache"
+down_revision = "20250410_01_texts_locked_at_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable with no default: existing rows keep being tokenized at export time.
+    op.add_column(
+        "texts",
+        sa.Column("tokens_cache", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("texts", "tokens_cache")
@@ -0,0 +1,47 @@
+"""Index an annotator's flags by type and creation time
+
+Revision ID: 20250420_01_skipped_texts_annotator_flag_index
+Revises: 20250415_01_texts_tokens_cache
+Create Date: 2025-04-20 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250420_01_skipped_texts_annotator_flag_index"
+down_revision = "20250415_01_texts_tokens_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Flag lists always filter on (annotator_id, flag_type) and order by created_at. The new
+    # index serves that exactly and still covers annotator_id-only lookups, so it replaces
+    # the (annotator_id, created_at) one.
+    op.create_index(
+        "ix_skipped_texts_annotator_flag_type_created_at",
+        "skipped_texts",
+        ["annotator_id", "flag_type", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_skipped_texts_annotator_created_at", table_name="skipped_texts", if_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_skipped_texts_annotator_created_at",
+        "skipped_texts",
+        ["annotator_id", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_skipped_texts_annotator_flag_type_created_at",
+        table_name="skipped_texts",
+        if_exists=True,
+    )
@@ -3,20 +3,28 @@ Typer-based admin CLI for managing users, categories, and imports, with optional
 overrides.
 """
 
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import typer
+from sqlalchemy import exists, insert, select
 from sqlalchemy.engine import URL, make_url
 
 from .config import get_settings
 from .database import configure_engine, session_scope
 from .models import Annotation, Category, TextSample, User
+from .routers.texts import _build_tokens_cache
 from .services import auth as auth_service
 
 cli = typer.Typer(help="Admin CLI for GEC annotation platform")
 
+# Rows per executemany when importing texts; keeps only one batch of row dicts alive.
+IMPORT_BATCH_SIZE = 10_000
+
 
 @cli.callback()
 def configure_cli(
@@ -36,19 +44,36 @@ def configure_cli(
         configure_engine(database_url)
         return
 
-    if any(param is not None for param in (db_host, db_port, db_name, db_user, db_password)):
-        base_settings = get_settings()
-        base_url = make_url(base_settings.database.url)
-        effective_url = URL.create(
-            drivername=base_url.drivername,
-            username=db_user or base_url.username,
-            password=db_password if db_password is not None else base_url.password,
-            host=db_host or base_url.host,
-            port=db_port if db_port is not None else base_url.port,
-            database=db_name or base_url.database,
-            query=base_url.query,
+    if all(param is None for param in (db_host, db_port, db_name, db_user, db_password)):
+        return
+
+    configure_engine(
+        _build_effective_url(
+            get_settings().database.url, db_host, db_port, db_name, db_user, db_password
         )
-        configure_engine(effective_url.render_as_string(hide_password=False))
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_effective_url(
+    base: str,
+    db_host: Optional[str],
+    db_port: Optional[int],
+    db_name: Optional[str],
+    db_user: Optional[str],
+    db_password: Optional[str],
+) -> str:
+    base_url = make_url(base)
+    effective_url = URL.create(
+        drivername=base_url.drivername,
+        username=db_user or base_url.username,
+        password=db_password if db_password is not None else base_url.password,
+        host=db_host or base_url.host,
+        port=db_port if db_port is not None else base_url.port,
+        database=db_name or base_url.database,
+        query=base_url.query,
+    )
+    return effective_url.render_as_string(hide_password=False)
 
 
 @cli.command(name="add-category")
@@ -76,7 +101,7 @@ def create_user(
 ):
     """Create a user (annotator by default)."""
     with session_scope() as session:
-        if session.query(User).filter(User.username == username).first():
+        if session.query(exists().where(User.username == username)).scalar():
             typer.echo("User already exists")
             raise typer.Exit(code=1)
         user = User(
@@ -89,10 +114,58 @@ def create_user(
         typer.echo(f"Created user with username '{username}'{'' if not full_name else '(' + full_name +')'} and role '{'admin' if admin else 'annotator'}'")
 
 
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    # bcrypt is CPU-bound, so larger batches are spread across processes.
+    workers = min(len(passwords), os.cpu_count() or 1)
+    if workers <= 1:
+        return [auth_service.get_password_hash(password) for password in passwords]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(auth_service.get_password_hash, passwords))
+
+
+@cli.command(name="import-users")
+def import_users(json_path: Path):
+    """Create users in bulk from a JSON list of {username, password, full_name?, role?}."""
+    entries = orjson.loads(json_path.read_bytes())
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise typer.BadParameter("JSON must be a list of user objects")
+    for entry in entries:
+        username = entry.get("username")
+        password = entry.get("password")
+        if not isinstance(username, str) or not username.strip():
+            raise typer.BadParameter("'username' must be a non-empty string")
+        if not isinstance(password, str) or not password:
+            raise typer.BadParameter(f"'password' for '{username}' must be a non-empty string")
+
+    usernames = [entry["username"] for entry in entries]
+    if len(set(usernames)) != len(usernames):
+        raise typer.BadParameter("Usernames must be unique")
+
+    with session_scope() as session:
+        existing = session.scalars(select(User.username).where(User.username.in_(usernames))).all()
+        if existing:
+            typer.echo(f"Users already exist: {', '.join(sorted(existing))}")
+            raise typer.Exit(code=1)
+
+        hashes = _hash_passwords([entry["password"] for entry in entries])
+        rows = [
+            {
+                "username": entry["username"],
+                "password_hash": password_hash,
+                "full_name": entry.get("full_name"),
+                "role": entry.get("role") or "annotator",
+            }
+            for entry, password_hash in zip(entries, hashes)
+        ]
+        if rows:
+            session.execute(insert(User), rows)
+        typer.echo(f"Imported {len(rows)} users")
+
+
 @cli.command()
 def import_texts(json_path: Path):
     """Import texts from a JSON object {category, required_annotations, content:[...]}."""
-    payload = json.loads(json_path.read_text())
+    payload = orjson.loads(json_path.read_bytes())
     if not isinstance(payload, dict):
         raise typer.BadParameter("JSON must be an object with category/content fields")
 
@@ -115,42 +188,67 @@ def import_texts(json_path: Path):
             session.add(category)
             session.flush()
 
-        for text_body in content_items:
-            session.add(
-                TextSample(
-                    content=text_body,
-                    category_id=category.id,
-                    required_annotations=required_annotations,
-                )
+        connection = session.connection()
+        if connection.dialect.driver == "psycopg":
+            # COPY streams every row in one message and skips per-statement parsing.
+            copy_sql = (
+                "COPY texts (content, tokens_cache, category_id, required_annotations, state) "
+                "FROM STDIN"
             )
+            with connection.connection.driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+                for text_body in content_items:
+                    tokens_cache = orjson.dumps(_build_tokens_cache(text_body)).decode()
+                    copy.write_row(
+                        (text_body, tokens_cache, category.id, required_annotations, "pending")
+                    )
+        else:
+            for start in range(0, len(content_items), IMPORT_BATCH_SIZE):
+                session.execute(
+                    insert(TextSample),
+                    [
+                        {
+                            "content": text_body,
+                            "tokens_cache": _build_tokens_cache(text_body),
+                            "category_id": category.id,
+                            "required_annotations": required_annotations,
+                        }
+                        for text_body in content_items[start : start + IMPORT_BATCH_SIZE]
+                    ],
+                )
         typer.echo(f"Imported {len(content_items)} texts into {category_name}")
 
 
 @cli.command()
 def export_annotations(output: Path):
     """Export annotations with metadata."""
-    with session_scope() as session:
-        rows = (
-            session.query(Annotation)
+    with session_scope() as session, output.open("wb") as handle:
+        rows = session.execute(
+            select(
+                Annotation.text_id,
+                Annotation.id.label("annotation_id"),
+                Annotation.author_id,
+                Annotation.start_token,
+                Annotation.end_token,
+                Annotation.replacement,
+                Annotation.error_type_id,
+                Annotation.payload,
+                Annotation.version,
+            )
+            # Walks ix_annotations_text_author_id, so the ordered export needs no sort step.
             .order_by(Annotation.text_id, Annotation.author_id, Annotation.id)
-            .all()
-        )
-        payload = [
-            {
-                "text_id": row.text_id,
-                "annotation_id": row.id,
-                "author_id": str(row.author_id),
-                "start_token": row.start_token,
-                "end_token": row.end_token,
-                "replacement": row.replacement,
-                "error_type_id": row.error_type_id,
-                "payload": row.payload,
-                "version": row.version,
-            }
-            for row in rows
-        ]
-        output.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
-        typer.echo(f"Exported {len(payload)} annotations to {output}")
+            .execution_options(yield_per=10_000)
+        ).mappings()
+        # Rows are streamed to disk one JSON object per line instead of being collected
+        # and serialized as a whole.
+        handle.write(b"[")
+        count = 0
+        for row in rows:
+            handle.write(b",\n" if count else b"\n")
+            # orjson writes UTF-8 bytes directly and serializes the author UUID natively.
+            handle.write(orjson.dumps(dict(row)))
+            count += 1
+        handle.write(b"\n]\n" if count else b"]\n")
+        typer.echo(f"Exported {count} annotations to {output}")
 
 
 if __name__ == "__main__":
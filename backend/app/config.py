@@ -3,6 +3,8 @@ Application settings and environment-driven configuration helpers.
 """
 
 from functools import lru_cache
+from typing import Optional
+
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,12 +16,22 @@ class DatabaseSettings(BaseModel):
     )
     pool_size: int = 10
     max_overflow: int = 10
+    prepare_threshold: Optional[int] = Field(
+        default=5,
+        description="psycopg executions before a query is server-side prepared (None disables)",
+    )
 
 
 class SecuritySettings(BaseModel):
     secret_key: str = Field(default="change-me", description="JWT signing key")
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 12
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor for new password hashes; lower it only for dev/seeding",
+    )
 
 
 class AppSettings(BaseSettings):
@@ -7,13 +7,19 @@ from contextlib import contextmanager
 from typing import Optional
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.pool import StaticPool
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from .config import get_settings
 
-engine = None
-SessionLocal = None
+# Built on first use (or by an explicit configure_engine call) so importing this module,
+# e.g. from the CLI before it applies --database-url, never opens a pool.
+engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+
+# Room for every distinct statement the routers and CLI compile (SQLAlchemy defaults to 500).
+QUERY_CACHE_SIZE = 1200
 
 
 def configure_engine(
@@ -27,30 +33,52 @@ def configure_engine(
     resolved_pool = pool_size if pool_size is not None else settings.database.pool_size
     resolved_overflow = max_overflow if max_overflow is not None else settings.database.max_overflow
 
-    global engine, SessionLocal
+    global engine, _session_factory
     if database_url.startswith("sqlite"):
         engine = create_engine(
             database_url,
             future=True,
             connect_args={"check_same_thread": False},
             poolclass=StaticPool,
+            query_cache_size=QUERY_CACHE_SIZE,
         )
     else:
+        connect_args = {}
+        if make_url(database_url).get_driver_name() == "psycopg":
+            # Repeated queries (auth lookups, category counters) skip parse/plan once prepared.
+            connect_args["prepare_threshold"] = settings.database.prepare_threshold
         engine = create_engine(
             database_url,
+            connect_args=connect_args,
             pool_size=resolved_pool,
             max_overflow=resolved_overflow,
             future=True,
+            insertmanyvalues_page_size=10000,
+            query_cache_size=QUERY_CACHE_SIZE,
+            # Recycling hour-old connections guards against server-side idle timeouts
+            # without the extra SELECT 1 round trip a pre-ping costs on every checkout.
+            pool_recycle=3600,
+            pool_pre_ping=False,
         )
-    SessionLocal = scoped_session(sessionmaker(bind=engine, autoflush=False, autocommit=False))
+    # Each request (get_db) and session_scope() owns its session, so no thread-local
+    # registry is needed; loaded attributes stay usable after commit.
+    _session_factory = sessionmaker(
+        bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+    )
+
+
+def get_engine() -> Engine:
+    """Return the global engine, configuring it from settings on first use."""
+    if engine is None:
+        configure_engine(get_settings().database.url)
+    return engine
 
 
-_default_settings = get_settings()
-configure_engine(
-    _default_settings.database.url,
-    pool_size=_default_settings.database.pool_size,
-    max_overflow=_default_settings.database.max_overflow,
-)
+def SessionLocal() -> Session:
+    """Open a session bound to the current global engine."""
+    if _session_factory is None:
+        get_engine()
+    return _session_factory()
 
 
 @contextmanager
@@ -3,19 +3,27 @@ FastAPI application setup that wires middleware, routers, and lifecycle hooks fo
 """
 
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .database import engine
+from .database import get_engine
 from .models import Base
 from .routers import auth, categories, error_types, texts, dashboard
 from .config import get_settings
 
-# Allow skipping table creation in test environments (e.g., sqlite without JSONB).
-if not os.getenv("SKIP_CREATE_ALL"):
-    Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Tatar GEC Annotation API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    engine = get_engine()
+    # Allow skipping table creation in test environments (e.g., sqlite without JSONB).
+    if not os.getenv("SKIP_CREATE_ALL"):
+        Base.metadata.create_all(bind=engine)
+    yield
+
+
+app = FastAPI(title="Tatar GEC Annotation API", version="0.1.0", lifespan=lifespan)
 
 settings = get_settings()
 allowed_origins = settings.allowed_origins or []
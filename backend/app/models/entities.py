@@ -4,10 +4,10 @@ and defaults.
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func, JSON
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func, JSON, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.type_api import TypeEngine
@@ -21,9 +21,7 @@ JsonType: TypeEngine = JSON().with_variant(JSONB, "postgresql")
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
-    )
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
@@ -39,7 +37,11 @@ class Category(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(128), unique=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
     is_hidden: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false")
 
     texts: Mapped[list["TextSample"]] = relationship(back_populates="category")
@@ -47,11 +49,25 @@ class Category(Base):
 
 class TextSample(Base):
     __tablename__ = "texts"
+    __table_args__ = (
+        Index("ix_texts_category_state", "category_id", "state"),
+        Index("uniq_text_external_id", "category_id", "external_id", unique=True),
+        # Partial: only locked rows are indexed, which is all the expired-lock sweep reads.
+        Index(
+            "ix_texts_locked_at",
+            "locked_at",
+            postgresql_where=text("locked_at IS NOT NULL"),
+            sqlite_where=text("locked_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     external_id: Mapped[Optional[str]] = mapped_column(String(64), index=True, nullable=True)
     category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # {"tokens": [...], "line_breaks": [...]} computed from content at import; NULL on
+    # rows created elsewhere, which are tokenized on demand. Only exports read it.
+    tokens_cache: Mapped[Optional[dict]] = mapped_column(JsonType, nullable=True, deferred=True)
     required_annotations: Mapped[int] = mapped_column(Integer, default=2)
     state: Mapped[str] = mapped_column(String(32), default="pending")
     locked_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("users.id"), nullable=True)
@@ -63,7 +79,12 @@ class TextSample(Base):
 
 class AnnotationTask(Base):
     __tablename__ = "annotation_tasks"
-    __table_args__ = (UniqueConstraint("text_id", "annotator_id", name="uniq_task"),)
+    __table_args__ = (
+        UniqueConstraint("text_id", "annotator_id", name="uniq_task"),
+        Index("ix_annotation_tasks_updated_at_id", "updated_at", "id"),
+        Index("ix_annotation_tasks_status_updated_at_id", "status", "updated_at", "id"),
+        Index("ix_annotation_tasks_status_text_id", "status", "text_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     text_id: Mapped[int] = mapped_column(ForeignKey("texts.id"), nullable=False)
@@ -111,6 +132,13 @@ class SkippedText(Base):
     __tablename__ = "skipped_texts"
     __table_args__ = (
         UniqueConstraint("text_id", "annotator_id", "flag_type", name="uniq_skipped_text"),
+        Index("ix_skipped_texts_flag_type_created_at_id", "flag_type", "created_at", "id"),
+        Index(
+            "ix_skipped_texts_annotator_flag_type_created_at",
+            "annotator_id",
+            "flag_type",
+            "created_at",
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -126,6 +154,7 @@ class SkippedText(Base):
 
 class Annotation(Base):
     __tablename__ = "annotations"
+    __table_args__ = (Index("ix_annotations_text_author_id", "text_id", "author_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     text_id: Mapped[int] = mapped_column(ForeignKey("texts.id"), nullable=False)
@@ -2,16 +2,15 @@
 Authentication endpoints for login and token issuance.
 """
 
-from datetime import timedelta
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
-from ..config import get_settings
 from ..models import User
 from ..schemas.common import Token, UserBase, UserCreate, UserUpdate
 from ..services.auth import (
+    ACCESS_TOKEN_EXPIRES,
     create_access_token,
     get_current_user,
     get_db,
@@ -19,9 +18,9 @@ from ..services.auth import (
     require_admin,
     verify_password,
 )
+from ..services.caches import invalidate_annotators
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
-settings = get_settings()
 
 
 @router.post("/token", response_model=Token)
@@ -31,14 +30,13 @@ def login_for_access_token(
     user = db.query(User).filter(User.username == form_data.username).one_or_none()
     if not user or not verify_password(form_data.password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect credentials")
-    access_token_expires = timedelta(minutes=settings.security.access_token_expire_minutes)
-    token = create_access_token(user.id, expires_delta=access_token_expires)
+    token = create_access_token(user.id, expires_delta=ACCESS_TOKEN_EXPIRES)
     return Token(access_token=token)
 
 
 @router.post("/users", response_model=UserBase)
 def create_user(user_in: UserCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    if db.query(User).filter(User.username == user_in.username).first():
+    if db.query(exists().where(User.username == user_in.username)).scalar():
         raise HTTPException(status_code=400, detail="Username already registered")
     user = User(
         username=user_in.username,
@@ -48,7 +46,7 @@ def create_user(user_in: UserCreate, db: Session = Depends(get_db), _: User = De
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
+    invalidate_annotators()
     return user
 
 
@@ -64,12 +62,10 @@ def update_current_user(
     current_user: User = Depends(get_current_user),
 ):
     if payload.username:
-        existing = (
-            db.query(User)
-            .filter(User.username == payload.username, User.id != current_user.id)
-            .one_or_none()
-        )
-        if existing:
+        taken = db.query(
+            exists().where(User.username == payload.username, User.id != current_user.id)
+        ).scalar()
+        if taken:
             raise HTTPException(status_code=400, detail="Username already registered")
         current_user.username = payload.username
 
@@ -77,5 +73,6 @@ def update_current_user(
         current_user.password_hash = get_password_hash(payload.password)
 
     db.commit()
-    db.refresh(current_user)
+    if payload.username:
+        invalidate_annotators()
     return current_user
@@ -2,60 +2,84 @@
 Category CRUD endpoints and related helpers.
 """
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import case, func
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from ..models import AnnotationTask, Category, TextSample
 from ..schemas.common import CategoryCreate, CategoryRead, CategoryUpdate
 from ..services.auth import get_current_user, get_db
+from ..services.caches import category_list_cache, invalidate_category_stats
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 
-def _load_category_stats(db: Session, category_ids: list[int] | None = None):
+_STAT_COLUMNS = ("total", "remaining", "in_progress", "locked", "skipped", "trashed", "awaiting")
+
+
+@lru_cache(maxsize=1)
+def _categories_with_stats():
+    """Categories outer-joined to their per-category text counters.
+
+    Built once and reused so SQLAlchemy's compiled-statement cache is hit on every call.
+    """
     submitted_counts = (
-        db.query(AnnotationTask.text_id, func.count().label("submitted"))
-        .filter(AnnotationTask.status == "submitted")
+        select(AnnotationTask.text_id, func.count().label("submitted"))
+        .where(AnnotationTask.status == "submitted")
         .group_by(AnnotationTask.text_id)
         .subquery()
     )
 
     submitted_count_expr = func.coalesce(submitted_counts.c.submitted, 0)
 
-    query = db.query(
-        TextSample.category_id.label("category_id"),
-        func.count(TextSample.id).label("total"),
-        func.sum(
-            case(
-                (
-                    (submitted_count_expr < TextSample.required_annotations)
-                    & ~TextSample.state.in_(["skipped", "trash"]),
-                    1,
-                ),
-                else_=0,
-            )
-        ).label("remaining"),
-        func.sum(case((TextSample.state == "in_annotation", 1), else_=0)).label("in_progress"),
-        func.sum(
-            case(
-                (
-                    (TextSample.locked_by_id.isnot(None))
-                    & ~TextSample.state.in_(["skipped", "trash", "awaiting_cross_validation"]),
-                    1,
-                ),
-                else_=0,
-            )
-        ).label("locked"),
-        func.sum(case((TextSample.state == "skipped", 1), else_=0)).label("skipped"),
-        func.sum(case((TextSample.state == "trash", 1), else_=0)).label("trashed"),
-        func.sum(case((TextSample.state == "awaiting_cross_validation", 1), else_=0)).label("awaiting"),
+    stats = (
+        select(
+            TextSample.category_id.label("category_id"),
+            func.count(TextSample.id).label("total"),
+            func.sum(
+                case(
+                    (
+                        (submitted_count_expr < TextSample.required_annotations)
+                        & ~TextSample.state.in_(["skipped", "trash"]),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ).label("remaining"),
+            func.sum(case((TextSample.state == "in_annotation", 1), else_=0)).label("in_progress"),
+            func.sum(
+                case(
+                    (
+                        (TextSample.locked_by_id.isnot(None))
+                        & ~TextSample.state.in_(["skipped", "trash", "awaiting_cross_validation"]),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ).label("locked"),
+            func.sum(case((TextSample.state == "skipped", 1), else_=0)).label("skipped"),
+            func.sum(case((TextSample.state == "trash", 1), else_=0)).label("trashed"),
+            func.sum(case((TextSample.state == "awaiting_cross_validation", 1), else_=0)).label(
+                "awaiting"
+            ),
+        )
+        .outerjoin(submitted_counts, submitted_counts.c.text_id == TextSample.id)
+        .group_by(TextSample.category_id)
+        .subquery("category_stats")
     )
-    query = query.outerjoin(submitted_counts, submitted_counts.c.text_id == TextSample.id)
-    if category_ids:
-        query = query.filter(TextSample.category_id.in_(category_ids))
-    rows = query.group_by(TextSample.category_id).all()
-    return {row.category_id: row for row in rows}
+    return select(
+        Category,
+        *(func.coalesce(stats.c[name], 0).label(name) for name in _STAT_COLUMNS),
+    ).outerjoin(stats, stats.c.category_id == Category.id)
+
+
+def _load_categories_with_stats(db: Session, *criteria):
+    stmt = _categories_with_stats().order_by(Category.created_at.desc(), Category.id.desc())
+    if criteria:
+        stmt = stmt.where(*criteria)
+    return db.execute(stmt).all()
 
 
 def _serialize_category(category: Category, stats) -> CategoryRead:
@@ -77,9 +101,11 @@ def _serialize_category(category: Category, stats) -> CategoryRead:
 
 @router.get("/", response_model=list[CategoryRead])
 def list_categories(db: Session = Depends(get_db), _: str = Depends(get_current_user)):
-    categories = db.query(Category).order_by(Category.created_at.desc(), Category.id.desc()).all()
-    stats_map = _load_category_stats(db, [category.id for category in categories])
-    return [_serialize_category(category, stats_map.get(category.id)) for category in categories]
+    def load() -> list[CategoryRead]:
+        rows = _load_categories_with_stats(db)
+        return [_serialize_category(row.Category, row) for row in rows]
+
+    return category_list_cache.get_or_set("all", load)
 
 
 @router.post("/", response_model=CategoryRead, status_code=status.HTTP_201_CREATED)
@@ -93,9 +119,9 @@ def create_category(
     obj = Category(name=category.name, description=category.description)
     db.add(obj)
     db.commit()
-    db.refresh(obj)
-    stats = _load_category_stats(db, [obj.id]).get(obj.id)
-    return _serialize_category(obj, stats)
+    invalidate_category_stats()
+    # Every column is populated client-side and a new category has no texts yet.
+    return _serialize_category(obj, None)
 
 
 @router.put("/{category_id}", response_model=CategoryRead)
@@ -118,9 +144,9 @@ def update_category(
     if payload.is_hidden is not None:
         category.is_hidden = payload.is_hidden
     db.commit()
-    db.refresh(category)
-    stats = _load_category_stats(db, [category.id]).get(category.id)
-    return _serialize_category(category, stats)
+    invalidate_category_stats()
+    (row,) = _load_categories_with_stats(db, Category.id == category.id)
+    return _serialize_category(row.Category, row)
 
 
 # @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -2,13 +2,33 @@
 Dashboard endpoints that aggregate annotation/task metrics and summary data for the UI.
 """
 
+import base64
+import binascii
+import json
+import re
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Annotated, NamedTuple, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, func
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BeforeValidator
+from sqlalchemy import (
+    DateTime,
+    String,
+    and_,
+    asc,
+    desc,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+)
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 
 from ..models import AnnotationTask, Category, SkippedText, TextSample, User
 from ..schemas.dashboard import (
@@ -23,325 +43,477 @@ from ..schemas.dashboard import (
     TaskEntry,
 )
 from ..services.auth import get_current_user, get_db
+from ..services.caches import annotators_cache, dashboard_stats_cache
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
+# One non-empty, whitespace-trimmed item of a comma-separated query value.
+_CSV_ITEM = re.compile(r"[^,\s]+")
 
-def _parse_int_list(value: Optional[str]) -> list[int]:
-    if not value:
-        return []
-    items: list[int] = []
-    for part in value.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        try:
-            items.append(int(part))
-        except ValueError:
-            continue
-    return items
-
-
-def _parse_uuid_list(value: Optional[str]) -> list[UUID]:
-    if not value:
-        return []
-    items: list[UUID] = []
-    for part in value.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        try:
-            items.append(UUID(part))
-        except ValueError:
-            continue
-    return items
+
+def _split_csv(value: object) -> object:
+    # Accept both ?ids=1,2 (what the SPA sends) and repeated ?ids=1&ids=2.
+    if isinstance(value, list):
+        return [part for item in value for part in _CSV_ITEM.findall(str(item))]
+    return value
+
+
+# Omitted filters arrive as None; the handlers only test them for truthiness.
+CategoryIds = Annotated[
+    Optional[list[int]],
+    BeforeValidator(_split_csv),
+    Query(description="Comma-separated category ids"),
+]
+AnnotatorIds = Annotated[
+    Optional[list[UUID]],
+    BeforeValidator(_split_csv),
+    Query(description="Comma-separated annotator uuids"),
+]
 
 
 def _normalize_statuses(raw: Optional[str]) -> list[str]:
     if raw is None:
         return []
-    return [part.strip() for part in raw.split(",") if part.strip()]
-
+    return _CSV_ITEM.findall(raw)
+
+
+# List endpoints project only the fields their entries need instead of hydrating the text,
+# category, and user entities behind every row.
+_TEXT_PREVIEW = func.substr(TextSample.content, 1, 200).label("text_preview")
+_TASK_COLUMNS = (
+    AnnotationTask.id,
+    AnnotationTask.text_id,
+    AnnotationTask.status,
+    AnnotationTask.updated_at,
+    _TEXT_PREVIEW,
+    TextSample.category_id,
+    Category.name.label("category_name"),
+    AnnotationTask.annotator_id,
+    User.username,
+    User.full_name,
+)
 
-@router.get("/stats", response_model=DashboardStats)
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    _: str = Depends(get_current_user),
-):
-    total_texts = db.query(func.count(TextSample.id)).scalar() or 0
-    pending = (
-        db.query(func.count(TextSample.id))
-        .filter(TextSample.state == "pending")
-        .scalar()
-        or 0
-    )
-    in_annotation = (
-        db.query(func.count(TextSample.id))
-        .filter(TextSample.state == "in_annotation")
-        .scalar()
-        or 0
+# Shared FROM/JOIN skeletons of the list endpoints. Requests only add filters, ordering,
+# and limits to these, so the statement shape stays identical across calls and its
+# compiled SQL is reused from the engine's statement cache.
+_FLAG_ROWS = (
+    select(
+        SkippedText.id,
+        SkippedText.flag_type,
+        SkippedText.reason,
+        SkippedText.created_at,
+        SkippedText.text_id,
+        _TEXT_PREVIEW,
+        TextSample.category_id,
+        Category.name.label("category_name"),
+        SkippedText.annotator_id,
+        User.username,
+        User.full_name,
     )
-    awaiting = (
-        db.query(func.count(TextSample.id))
-        .filter(TextSample.state == "awaiting_cross_validation")
-        .scalar()
-        or 0
-    )
-    submitted_tasks = (
-        db.query(func.count(AnnotationTask.id))
-        .filter(AnnotationTask.status == "submitted")
-        .scalar()
-        or 0
+    .join(TextSample, SkippedText.text_id == TextSample.id)
+    .join(Category, TextSample.category_id == Category.id)
+    .join(User, SkippedText.annotator_id == User.id)
+)
+_TASK_ROWS = (
+    select(*_TASK_COLUMNS)
+    .join(TextSample, AnnotationTask.text_id == TextSample.id)
+    .join(Category, TextSample.category_id == Category.id)
+    .join(User, AnnotationTask.annotator_id == User.id)
+)
+# Both halves of the activity UNION ALL project the same columns.
+_FLAG_ACTIVITY = select(
+    SkippedText.id,
+    SkippedText.text_id,
+    SkippedText.flag_type.label("kind"),
+    SkippedText.flag_type.label("status"),
+    SkippedText.created_at.label("occurred_at"),
+    TextSample.category_id,
+    SkippedText.annotator_id,
+).join(TextSample, SkippedText.text_id == TextSample.id)
+_TASK_ACTIVITY = select(
+    AnnotationTask.id,
+    AnnotationTask.text_id,
+    literal("task", String).label("kind"),
+    AnnotationTask.status,
+    AnnotationTask.updated_at.label("occurred_at"),
+    TextSample.category_id,
+    AnnotationTask.annotator_id,
+).join(TextSample, AnnotationTask.text_id == TextSample.id)
+
+
+# Sort names accepted by the list endpoints mapped to the column each one orders by.
+_SHARED_SORT_COLUMNS = {"category": Category.name, "annotator": User.username, "text": TextSample.id}
+_FLAG_SORT_COLUMNS = {
+    "created_at": SkippedText.created_at,
+    "updated_at": SkippedText.created_at,
+    **_SHARED_SORT_COLUMNS,
+}
+_TASK_SORT_COLUMNS = {"updated_at": AnnotationTask.updated_at, **_SHARED_SORT_COLUMNS}
+
+
+class _Summaries:
+    """Per-request memo of the nested category/annotator models.
+
+    Rows on a page mostly repeat a handful of categories and annotators, so each
+    summary is built once per id and shared. The values come straight from typed
+    columns, which lets ``model_construct`` skip validation.
+    """
+
+    def __init__(self) -> None:
+        self._categories: dict[int, CategorySummary] = {}
+        self._annotators: dict[UUID, AnnotatorSummary] = {}
+
+    def category(self, row) -> CategorySummary:
+        summary = self._categories.get(row.category_id)
+        if summary is None:
+            summary = self._categories[row.category_id] = CategorySummary.model_construct(
+                id=row.category_id, name=row.category_name
+            )
+        return summary
+
+    def annotator(self, row) -> AnnotatorSummary:
+        summary = self._annotators.get(row.annotator_id)
+        if summary is None:
+            summary = self._annotators[row.annotator_id] = AnnotatorSummary.model_construct(
+                id=row.annotator_id, username=row.username, full_name=row.full_name
+            )
+        return summary
+
+
+def _encode_cursor(sort_value, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, order_column) -> tuple[object, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        if isinstance(order_column.type, DateTime):
+            sort_value = datetime.fromisoformat(sort_value)
+        if not isinstance(row_id, int):
+            raise ValueError(row_id)
+    except (binascii.Error, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return sort_value, row_id
+
+
+class _Page(NamedTuple):
+    rows: list
+    next_cursor: Optional[str]
+    next_offset: Optional[int]
+    total: Optional[int]
+
+
+def _paginate(
+    db: Session,
+    stmt: Select,
+    order_column,
+    id_column,
+    *,
+    order: str,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    include_total: bool = False,
+) -> _Page:
+    """Page ``stmt`` by ``order_column`` with ``id_column`` (always descending) as tie-breaker.
+
+    A cursor seeks past the last row of the previous page instead of scanning and discarding
+    ``offset`` rows; ``offset`` is still honoured when no cursor is given. With
+    ``include_total`` the filtered row count rides along on the page rows as a window
+    aggregate; it is only meaningful before a cursor narrows the filter.
+    """
+    descending = order == "desc"
+    if cursor:
+        sort_value, last_id = _decode_cursor(cursor, order_column)
+        if descending:
+            stmt = stmt.where(tuple_(order_column, id_column) < tuple_(sort_value, last_id))
+        else:
+            stmt = stmt.where(
+                or_(
+                    order_column > sort_value,
+                    and_(order_column == sort_value, id_column < last_id),
+                )
+            )
+    order_expr = order_column.desc() if descending else order_column.asc()
+    stmt = stmt.add_columns(order_column.label("sort_value")).order_by(
+        order_expr, id_column.desc()
     )
-    skipped_count = (
-        db.query(func.count(SkippedText.id))
-        .filter(SkippedText.flag_type == "skip")
-        .scalar()
-        or 0
+    count_rows = include_total and not cursor
+    if count_rows:
+        stmt = stmt.add_columns(func.count().over().label("total"))
+    if offset and not cursor:
+        stmt = stmt.offset(offset)
+    rows = db.execute(stmt.limit(limit + 1)).all()
+
+    total = None
+    if count_rows and (rows or not offset):
+        total = rows[0].total if rows else 0
+    next_cursor = next_offset = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].sort_value, rows[-1]._mapping[id_column])
+        if not cursor:
+            next_offset = offset + limit
+    return _Page(rows, next_cursor, next_offset, total)
+
+
+@lru_cache(maxsize=1)
+def _dashboard_stats_query():
+    """Every dashboard counter as one row, so the stats endpoint is a single round trip."""
+    text_counts = (
+        select(
+            func.count().label("total_texts"),
+            func.count().filter(TextSample.state == "pending").label("pending_texts"),
+            func.count().filter(TextSample.state == "in_annotation").label("in_annotation_texts"),
+            func.count()
+            .filter(TextSample.state == "awaiting_cross_validation")
+            .label("awaiting_review_texts"),
+        )
+        .select_from(TextSample)
+        .subquery("text_counts")
     )
-    trashed_count = (
-        db.query(func.count(SkippedText.id))
-        .filter(SkippedText.flag_type == "trash")
-        .scalar()
-        or 0
+    task_counts = (
+        select(func.count().label("submitted_tasks"))
+        .select_from(AnnotationTask)
+        .where(AnnotationTask.status == "submitted")
+        .subquery("task_counts")
     )
-
-    completed_subquery = (
-        db.query(TextSample.id)
-        .outerjoin(
-            AnnotationTask,
-            and_(
-                AnnotationTask.text_id == TextSample.id,
-                AnnotationTask.status == "submitted",
-            ),
+    flag_counts = (
+        select(
+            func.count().filter(SkippedText.flag_type == "skip").label("skipped_count"),
+            func.count().filter(SkippedText.flag_type == "trash").label("trashed_count"),
         )
-        .group_by(TextSample.id, TextSample.required_annotations)
-        .having(func.count(AnnotationTask.id) >= TextSample.required_annotations)
+        .select_from(SkippedText)
+        .subquery("flag_counts")
+    )
+    # Group only the submitted tasks, then look up each text's requirement, rather than
+    # grouping every text (required_annotations is always at least 1).
+    submitted_per_text = (
+        select(AnnotationTask.text_id, func.count().label("submitted"))
+        .where(AnnotationTask.status == "submitted")
+        .group_by(AnnotationTask.text_id)
         .subquery()
     )
-    completed_texts = db.query(func.count()).select_from(completed_subquery).scalar() or 0
-
-    return DashboardStats(
-        total_texts=total_texts,
-        pending_texts=pending,
-        in_annotation_texts=in_annotation,
-        awaiting_review_texts=awaiting,
-        completed_texts=completed_texts,
-        submitted_tasks=submitted_tasks,
-        skipped_count=skipped_count,
-        trashed_count=trashed_count,
-        last_updated=datetime.utcnow(),
+    completed_counts = (
+        select(func.count().label("completed_texts"))
+        .select_from(submitted_per_text)
+        .join(TextSample, TextSample.id == submitted_per_text.c.text_id)
+        .where(submitted_per_text.c.submitted >= TextSample.required_annotations)
+        .subquery("completed_counts")
+    )
+    return select(text_counts, task_counts, flag_counts, completed_counts).select_from(
+        text_counts.join(task_counts, true())
+        .join(flag_counts, true())
+        .join(completed_counts, true())
     )
 
 
+@router.get("/stats", response_model=DashboardStats)
+def get_dashboard_stats(
+    db: Session = Depends(get_db),
+    _: str = Depends(get_current_user),
+):
+    def load() -> DashboardStats:
+        counts = db.execute(_dashboard_stats_query()).mappings().one()
+        return DashboardStats(**counts, last_updated=datetime.utcnow())
+
+    return dashboard_stats_cache.get_or_set("stats", load)
+
+
 @router.get("/annotators", response_model=list[AnnotatorSummary])
 def list_annotators(
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    rows = (
-        db.query(User)
-        .order_by(User.full_name.is_(None), User.full_name, User.username)
-        .all()
-    )
-    return [
-        AnnotatorSummary(id=row.id, username=row.username, full_name=row.full_name)
-        for row in rows
-    ]
+    def load() -> list[AnnotatorSummary]:
+        rows = db.execute(
+            select(User.id, User.username, User.full_name).order_by(
+                User.full_name.is_(None), User.full_name, User.username
+            )
+        ).all()
+        return [
+            AnnotatorSummary(id=row.id, username=row.username, full_name=row.full_name)
+            for row in rows
+        ]
+
+    return annotators_cache.get_or_set("annotators", load)
 
 
 @router.get("/flagged", response_model=PaginatedFlagged)
 def list_flagged(
     flag_type: str = Query("skip", pattern="^(skip|trash)$"),
-    category_ids: Optional[str] = Query(None, description="Comma-separated category ids"),
-    annotator_ids: Optional[str] = Query(None, description="Comma-separated annotator uuids"),
+    category_ids: CategoryIds = None,
+    annotator_ids: AnnotatorIds = None,
     start: Optional[datetime] = Query(None, description="Start datetime (inclusive)"),
     end: Optional[datetime] = Query(None, description="End datetime (inclusive)"),
     sort: str = Query("created_at", pattern="^(created_at|updated_at|category|annotator|text)$"),
     order: str = Query("desc", pattern="^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Deprecated; use cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also count all matching rows (first page only)"),
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    category_list = _parse_int_list(category_ids)
-    annotator_list = _parse_uuid_list(annotator_ids)
-
-    query = (
-        db.query(SkippedText, TextSample, Category, User)
-        .join(TextSample, SkippedText.text_id == TextSample.id)
-        .join(Category, TextSample.category_id == Category.id)
-        .join(User, SkippedText.annotator_id == User.id)
-        .filter(SkippedText.flag_type == flag_type)
-    )
-    if category_list:
-        query = query.filter(TextSample.category_id.in_(category_list))
-    if annotator_list:
-        query = query.filter(SkippedText.annotator_id.in_(annotator_list))
+    stmt = _FLAG_ROWS.where(SkippedText.flag_type == flag_type)
+    if category_ids:
+        stmt = stmt.where(TextSample.category_id.in_(category_ids))
+    if annotator_ids:
+        stmt = stmt.where(SkippedText.annotator_id.in_(annotator_ids))
     if start:
-        query = query.filter(SkippedText.created_at >= start)
+        stmt = stmt.where(SkippedText.created_at >= start)
     if end:
-        query = query.filter(SkippedText.created_at <= end)
-
-    if sort == "category":
-        order_column = Category.name
-    elif sort == "annotator":
-        order_column = User.username
-    elif sort == "text":
-        order_column = TextSample.id
-    else:
-        order_column = SkippedText.created_at
-
-    order_expr = order_column.desc() if order == "desc" else order_column.asc()
-    rows = (
-        query.order_by(order_expr, SkippedText.id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+        stmt = stmt.where(SkippedText.created_at <= end)
+
+    order_column = _FLAG_SORT_COLUMNS[sort]
+
+    page = _paginate(
+        db,
+        stmt,
+        order_column,
+        SkippedText.id,
+        order=order,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
 
+    summaries = _Summaries()
     items = [
         FlaggedEntry(
-          id=flag.id,
-          flag_type=flag.flag_type,
-          reason=flag.reason,
-          created_at=flag.created_at,
-          text_id=text.id,
-          text_preview=(text.content or "")[:200],
-          category=CategorySummary(id=category.id, name=category.name),
-          annotator=AnnotatorSummary(id=user.id, username=user.username, full_name=user.full_name),
+            id=row.id,
+            flag_type=row.flag_type,
+            reason=row.reason,
+            created_at=row.created_at,
+            text_id=row.text_id,
+            text_preview=row.text_preview or "",
+            category=summaries.category(row),
+            annotator=summaries.annotator(row),
         )
-        for flag, text, category, user in rows
+        for row in page.rows
     ]
-    next_offset = offset + len(items) if len(items) == limit else None
-    return PaginatedFlagged(items=items, next_offset=next_offset)
+    return PaginatedFlagged(
+        items=items, next_offset=page.next_offset, next_cursor=page.next_cursor, total=page.total
+    )
 
 
 @router.get("/submitted", response_model=PaginatedTasks)
 def list_submitted_tasks(
-    category_ids: Optional[str] = Query(None, description="Comma-separated category ids"),
-    annotator_ids: Optional[str] = Query(None, description="Comma-separated annotator uuids"),
+    category_ids: CategoryIds = None,
+    annotator_ids: AnnotatorIds = None,
     start: Optional[datetime] = Query(None, description="Start datetime (inclusive)"),
     end: Optional[datetime] = Query(None, description="End datetime (inclusive)"),
     sort: str = Query("updated_at", pattern="^(updated_at|category|annotator|text)$"),
     order: str = Query("desc", pattern="^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Deprecated; use cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also count all matching rows (first page only)"),
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    category_list = _parse_int_list(category_ids)
-    annotator_list = _parse_uuid_list(annotator_ids)
-    query = (
-        db.query(AnnotationTask, TextSample, Category, User)
-        .join(TextSample, AnnotationTask.text_id == TextSample.id)
-        .join(Category, TextSample.category_id == Category.id)
-        .join(User, AnnotationTask.annotator_id == User.id)
-        .filter(AnnotationTask.status == "submitted")
-    )
-    if category_list:
-        query = query.filter(TextSample.category_id.in_(category_list))
-    if annotator_list:
-        query = query.filter(AnnotationTask.annotator_id.in_(annotator_list))
+    stmt = _TASK_ROWS.where(AnnotationTask.status == "submitted")
+    if category_ids:
+        stmt = stmt.where(TextSample.category_id.in_(category_ids))
+    if annotator_ids:
+        stmt = stmt.where(AnnotationTask.annotator_id.in_(annotator_ids))
     if start:
-        query = query.filter(AnnotationTask.updated_at >= start)
+        stmt = stmt.where(AnnotationTask.updated_at >= start)
     if end:
-        query = query.filter(AnnotationTask.updated_at <= end)
-
-    if sort == "category":
-        order_column = Category.name
-    elif sort == "annotator":
-        order_column = User.username
-    elif sort == "text":
-        order_column = TextSample.id
-    else:
-        order_column = AnnotationTask.updated_at
-
-    order_expr = order_column.desc() if order == "desc" else order_column.asc()
-    rows = (
-        query.order_by(order_expr, AnnotationTask.id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+        stmt = stmt.where(AnnotationTask.updated_at <= end)
+
+    order_column = _TASK_SORT_COLUMNS[sort]
+
+    page = _paginate(
+        db,
+        stmt,
+        order_column,
+        AnnotationTask.id,
+        order=order,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
 
+    summaries = _Summaries()
     items = [
         TaskEntry(
-            task_id=task.id,
-            text_id=text.id,
-            status=task.status,
-            updated_at=task.updated_at,
-            text_preview=(text.content or "")[:200],
-            category=CategorySummary(id=category.id, name=category.name),
-            annotator=AnnotatorSummary(id=user.id, username=user.username, full_name=user.full_name),
+            task_id=row.id,
+            text_id=row.text_id,
+            status=row.status,
+            updated_at=row.updated_at,
+            text_preview=row.text_preview or "",
+            category=summaries.category(row),
+            annotator=summaries.annotator(row),
         )
-        for task, text, category, user in rows
+        for row in page.rows
     ]
-    next_offset = offset + len(items) if len(items) == limit else None
-    return PaginatedTasks(items=items, next_offset=next_offset)
+    return PaginatedTasks(
+        items=items, next_offset=page.next_offset, next_cursor=page.next_cursor, total=page.total
+    )
 
 
 @router.get("/history", response_model=PaginatedTasks)
 def list_history(
-    category_ids: Optional[str] = Query(None, description="Comma-separated category ids"),
-    annotator_ids: Optional[str] = Query(None, description="Comma-separated annotator uuids"),
+    category_ids: CategoryIds = None,
+    annotator_ids: AnnotatorIds = None,
     start: Optional[datetime] = Query(None, description="Start datetime (inclusive)"),
     end: Optional[datetime] = Query(None, description="End datetime (inclusive)"),
     sort: str = Query("updated_at", pattern="^(updated_at|category|annotator|text)$"),
     order: str = Query("desc", pattern="^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Deprecated; use cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also count all matching rows (first page only)"),
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    category_list = _parse_int_list(category_ids)
-    annotator_list = _parse_uuid_list(annotator_ids)
-    query = (
-        db.query(AnnotationTask, TextSample, Category, User)
-        .join(TextSample, AnnotationTask.text_id == TextSample.id)
-        .join(Category, TextSample.category_id == Category.id)
-        .join(User, AnnotationTask.annotator_id == User.id)
-    )
-    if category_list:
-        query = query.filter(TextSample.category_id.in_(category_list))
-    if annotator_list:
-        query = query.filter(AnnotationTask.annotator_id.in_(annotator_list))
+    stmt = _TASK_ROWS
+    if category_ids:
+        stmt = stmt.where(TextSample.category_id.in_(category_ids))
+    if annotator_ids:
+        stmt = stmt.where(AnnotationTask.annotator_id.in_(annotator_ids))
     if start:
-        query = query.filter(AnnotationTask.updated_at >= start)
+        stmt = stmt.where(AnnotationTask.updated_at >= start)
     if end:
-        query = query.filter(AnnotationTask.updated_at <= end)
-
-    if sort == "category":
-        order_column = Category.name
-    elif sort == "annotator":
-        order_column = User.username
-    elif sort == "text":
-        order_column = TextSample.id
-    else:
-        order_column = AnnotationTask.updated_at
-
-    order_expr = order_column.desc() if order == "desc" else order_column.asc()
-    rows = (
-        query.order_by(order_expr, AnnotationTask.id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+        stmt = stmt.where(AnnotationTask.updated_at <= end)
+
+    order_column = _TASK_SORT_COLUMNS[sort]
+
+    page = _paginate(
+        db,
+        stmt,
+        order_column,
+        AnnotationTask.id,
+        order=order,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
 
+    summaries = _Summaries()
     items = [
         TaskEntry(
-            task_id=task.id,
-            text_id=text.id,
-            status=task.status,
-            updated_at=task.updated_at,
-            text_preview=(text.content or "")[:200],
-            category=CategorySummary(id=category.id, name=category.name),
-            annotator=AnnotatorSummary(id=user.id, username=user.username, full_name=user.full_name),
+            task_id=row.id,
+            text_id=row.text_id,
+            status=row.status,
+            updated_at=row.updated_at,
+            text_preview=row.text_preview or "",
+            category=summaries.category(row),
+            annotator=summaries.annotator(row),
         )
-        for task, text, category, user in rows
+        for row in page.rows
     ]
-    next_offset = offset + len(items) if len(items) == limit else None
-    return PaginatedTasks(items=items, next_offset=next_offset)
+    return PaginatedTasks(
+        items=items, next_offset=page.next_offset, next_cursor=page.next_cursor, total=page.total
+    )
 
 
 @router.get("/activity", response_model=PaginatedActivity)
@@ -352,8 +524,8 @@ def list_activity(
     ),
     task_statuses: Optional[str] = Query(None, description="Comma-separated task statuses to include"),
     query: Optional[str] = Query(None, description="Case-insensitive substring to match in text content"),
-    category_ids: Optional[str] = Query(None, description="Comma-separated category ids"),
-    annotator_ids: Optional[str] = Query(None, description="Comma-separated annotator uuids"),
+    category_ids: CategoryIds = None,
+    annotator_ids: AnnotatorIds = None,
     start: Optional[datetime] = Query(None, description="Start datetime (inclusive)"),
     end: Optional[datetime] = Query(None, description="End datetime (inclusive)"),
     sort: str = Query("occurred_at", pattern="^(occurred_at|category|annotator|text)$"),
@@ -363,110 +535,115 @@ def list_activity(
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    category_list = _parse_int_list(category_ids)
-    annotator_list = _parse_uuid_list(annotator_ids)
-    kind_list = [kind.strip() for kind in (kinds or "").split(",") if kind.strip()]
+    kind_list = _CSV_ITEM.findall(kinds or "")
     if not kind_list:
         kind_list = ["skip", "trash", "task"]
 
     statuses = _normalize_statuses(task_statuses)
-    max_fetch = min(limit + offset + 200, 2000)
-
-    items: list[ActivityItem] = []
     text_filter = None
     if query:
         text_filter = TextSample.content.ilike(f"%{query}%")
 
-    if any(kind in kind_list for kind in ("skip", "trash")):
-        flag_query = (
-            db.query(SkippedText, TextSample, Category, User)
-            .join(TextSample, SkippedText.text_id == TextSample.id)
-            .join(Category, TextSample.category_id == Category.id)
-            .join(User, SkippedText.annotator_id == User.id)
-            .filter(SkippedText.flag_type.in_([k for k in kind_list if k in ("skip", "trash")]))
-        )
-        if category_list:
-            flag_query = flag_query.filter(TextSample.category_id.in_(category_list))
-        if annotator_list:
-            flag_query = flag_query.filter(SkippedText.annotator_id.in_(annotator_list))
+    # Flags and tasks are merged, ordered, and paged by the database; both branches project
+    # the same columns so only the requested page ever leaves it.
+    branches = []
+    flag_kinds = [kind for kind in kind_list if kind in ("skip", "trash")]
+    if flag_kinds:
+        flag_branch = _FLAG_ACTIVITY.where(SkippedText.flag_type.in_(flag_kinds))
+        if category_ids:
+            flag_branch = flag_branch.where(TextSample.category_id.in_(category_ids))
+        if annotator_ids:
+            flag_branch = flag_branch.where(SkippedText.annotator_id.in_(annotator_ids))
         if start:
-            flag_query = flag_query.filter(SkippedText.created_at >= start)
+            flag_branch = flag_branch.where(SkippedText.created_at >= start)
         if end:
-            flag_query = flag_query.filter(SkippedText.created_at <= end)
+            flag_branch = flag_branch.where(SkippedText.created_at <= end)
         if text_filter is not None:
-            flag_query = flag_query.filter(text_filter)
-        flag_rows = (
-            flag_query.order_by(SkippedText.created_at.desc(), SkippedText.id.desc())
-            .limit(max_fetch)
-            .all()
-        )
-        items.extend(
-            ActivityItem(
-                id=flag.id,
-                text_id=text.id,
-                kind=flag.flag_type,  # type: ignore[arg-type]
-                status=flag.flag_type,
-                occurred_at=flag.created_at,
-                text_preview=(text.content or "")[:200],
-                category=CategorySummary(id=category.id, name=category.name),
-                annotator=AnnotatorSummary(id=user.id, username=user.username, full_name=user.full_name),
-            )
-            for flag, text, category, user in flag_rows
-        )
+            flag_branch = flag_branch.where(text_filter)
+        branches.append(flag_branch)
 
     if "task" in kind_list:
-        task_query = (
-            db.query(AnnotationTask, TextSample, Category, User)
-            .join(TextSample, AnnotationTask.text_id == TextSample.id)
-            .join(Category, TextSample.category_id == Category.id)
-            .join(User, AnnotationTask.annotator_id == User.id)
-        )
+        task_branch = _TASK_ACTIVITY
         if statuses:
-            task_query = task_query.filter(AnnotationTask.status.in_(statuses))
-        if category_list:
-            task_query = task_query.filter(TextSample.category_id.in_(category_list))
-        if annotator_list:
-            task_query = task_query.filter(AnnotationTask.annotator_id.in_(annotator_list))
+            task_branch = task_branch.where(AnnotationTask.status.in_(statuses))
+        if category_ids:
+            task_branch = task_branch.where(TextSample.category_id.in_(category_ids))
+        if annotator_ids:
+            task_branch = task_branch.where(AnnotationTask.annotator_id.in_(annotator_ids))
         if start:
-            task_query = task_query.filter(AnnotationTask.updated_at >= start)
+            task_branch = task_branch.where(AnnotationTask.updated_at >= start)
         if end:
-            task_query = task_query.filter(AnnotationTask.updated_at <= end)
+            task_branch = task_branch.where(AnnotationTask.updated_at <= end)
         if text_filter is not None:
-            task_query = task_query.filter(text_filter)
+            task_branch = task_branch.where(text_filter)
+        branches.append(task_branch)
+
+    if not branches:
+        return PaginatedActivity(items=[])
 
-        task_rows = (
-            task_query.order_by(AnnotationTask.updated_at.desc(), AnnotationTask.id.desc())
-            .limit(max_fetch)
-            .all()
+    activity = union_all(*branches).subquery("activity")
+    sort_source = activity
+    if sort == "category":
+        sort_source = activity.join(Category, Category.id == activity.c.category_id)
+        sort_key = func.lower(Category.name)
+    elif sort == "annotator":
+        sort_source = activity.join(User, User.id == activity.c.annotator_id)
+        sort_key = func.lower(User.username)
+    elif sort == "text":
+        sort_key = activity.c.text_id
+    else:
+        sort_key = activity.c.occurred_at
+
+    direction = desc if order == "desc" else asc
+    page = (
+        select(activity, sort_key.label("sort_key"))
+        .select_from(sort_source)
+        .order_by(
+            direction(sort_key),
+            direction(activity.c.occurred_at),
+            activity.c.kind,
+            activity.c.id.desc(),
         )
-        items.extend(
-            ActivityItem(
-                id=task.id,
-                text_id=text.id,
-                kind="task",
-                status=task.status,
-                occurred_at=task.updated_at,
-                text_preview=(text.content or "")[:200],
-                category=CategorySummary(id=category.id, name=category.name),
-                annotator=AnnotatorSummary(id=user.id, username=user.username, full_name=user.full_name),
-            )
-            for task, text, category, user in task_rows
+        .limit(limit + 1)
+        .offset(offset)
+        .subquery("page")
+    )
+    rows = db.execute(
+        select(
+            page,
+            func.substr(TextSample.content, 1, 200).label("text_preview"),
+            Category.name.label("category_name"),
+            User.username,
+            User.full_name,
         )
+        .select_from(page)
+        .join(TextSample, TextSample.id == page.c.text_id)
+        .join(Category, Category.id == page.c.category_id)
+        .join(User, User.id == page.c.annotator_id)
+        .order_by(
+            direction(page.c.sort_key),
+            direction(page.c.occurred_at),
+            page.c.kind,
+            page.c.id.desc(),
+        )
+    ).all()
 
-    def _sort_key(item: ActivityItem):
-        if sort == "category":
-            return (item.category.name.lower() if item.category.name else "", item.occurred_at)
-        if sort == "annotator":
-            return (item.annotator.username.lower(), item.occurred_at)
-        if sort == "text":
-            return (item.text_id, item.occurred_at)
-        return (item.occurred_at,)
-
-    reverse = order == "desc"
-    items.sort(key=_sort_key, reverse=reverse)
-
-    slice_start = min(offset, len(items))
-    slice_end = min(slice_start + limit, len(items))
-    page_items = items[slice_start:slice_end]
-    next_offset = slice_end if slice_end < len(items) else None
-    return PaginatedActivity(items=page_items, next_offset=next_offset)
+    next_offset = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_offset = offset + limit
+    summaries = _Summaries()
+    items = [
+        ActivityItem(
+            id=row.id,
+            text_id=row.text_id,
+            kind=row.kind,
+            status=row.status,
+            occurred_at=row.occurred_at,
+            text_preview=row.text_preview or "",
+            category=summaries.category(row),
+            annotator=summaries.annotator(row),
+        )
+        for row in rows
+    ]
+    return PaginatedActivity(items=items, next_offset=next_offset)
@@ -2,18 +2,21 @@
 Error type CRUD endpoints with category-aware ordering and preference handling.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..models import ErrorType, UserErrorType
 from ..schemas.common import OrmBase
 from ..services.auth import get_current_user, get_db
+from ..services.caches import error_type_list_cache, invalidate_error_types
 
 router = APIRouter(prefix="/api/error-types", tags=["error-types"])
 
-
 class ErrorTypeBase(BaseModel):
     description: str | None = None
     sort_order: int | None = None
@@ -46,6 +49,9 @@ class ErrorTypeRead(OrmBase, ErrorTypeBase):
     id: int
 
 
+_ERROR_TYPE_LIST = TypeAdapter(list[ErrorTypeRead])
+
+
 class ErrorTypePreference(BaseModel):
     color: str | None = None
     hotkey: str | None = None
@@ -68,18 +74,36 @@ def _sanitize_description(value: str | None) -> str | None:
     return _sanitize_str(value)
 
 
+def _next_sort_order(category_en: str | None):
+    """Scalar subquery for the position after the last error type in ``category_en``."""
+    return (
+        select(func.coalesce(func.max(ErrorType.sort_order), 0) + 1)
+        .where(ErrorType.category_en.is_not_distinct_from(category_en))
+        .scalar_subquery()
+    )
+
+
 @router.get("/", response_model=list[ErrorTypeRead])
 def list_error_types(
     include_inactive: bool = Query(False, description="Include inactive error types"),
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    query = db.query(ErrorType)
-    if not include_inactive:
-        query = query.filter(ErrorType.is_active.is_(True))
-    return query.order_by(
-        ErrorType.category_en, ErrorType.sort_order, ErrorType.en_name, ErrorType.id
-    ).all()
+    def load() -> bytes:
+        query = db.query(ErrorType)
+        if not include_inactive:
+            query = query.filter(ErrorType.is_active.is_(True))
+        rows = query.order_by(
+            ErrorType.category_en, ErrorType.sort_order, ErrorType.en_name, ErrorType.id
+        ).all()
+        items = _ERROR_TYPE_LIST.validate_python(rows, from_attributes=True)
+        return _ERROR_TYPE_LIST.dump_json(items)
+
+    # The encoded body is cached and returned as-is, so cache hits skip response_model
+    # validation and serialization entirely.
+    return Response(
+        error_type_list_cache.get_or_set(include_inactive, load), media_type="application/json"
+    )
 
 
 # @router.get("/preferences", response_model=list[UserPreferenceRead])
@@ -108,30 +132,26 @@ def create_error_type(
     _: str = Depends(get_current_user),
 ):
     category_en = _sanitize_str(payload.category_en)
-    category_tt = _sanitize_str(payload.category_tt)
     sort_order = payload.sort_order
-    if sort_order is None:
-        max_query = db.query(func.max(ErrorType.sort_order))
-        if category_en is None:
-            max_query = max_query.filter(ErrorType.category_en.is_(None))
-        else:
-            max_query = max_query.filter(ErrorType.category_en == category_en)
-        max_order = max_query.scalar() or 0
-        sort_order = max_order + 1
-    obj = ErrorType(
-        description=_sanitize_description(payload.description),
-        sort_order=sort_order,
-        default_color=payload.default_color or "#f97316",
-        default_hotkey=_sanitize_str(payload.default_hotkey),
-        category_en=category_en,
-        category_tt=category_tt,
-        en_name=_sanitize_str(payload.en_name),
-        tt_name=_sanitize_str(payload.tt_name),
-        is_active=payload.is_active,
+    # Computing the next position inside the INSERT saves a round trip.
+    stmt = (
+        insert(ErrorType)
+        .values(
+            description=_sanitize_description(payload.description),
+            sort_order=sort_order if sort_order is not None else _next_sort_order(category_en),
+            default_color=payload.default_color or "#f97316",
+            default_hotkey=_sanitize_str(payload.default_hotkey),
+            category_en=category_en,
+            category_tt=_sanitize_str(payload.category_tt),
+            en_name=_sanitize_str(payload.en_name),
+            tt_name=_sanitize_str(payload.tt_name),
+            is_active=payload.is_active,
+        )
+        .returning(ErrorType)
     )
-    db.add(obj)
+    obj = db.scalars(stmt).one()
     db.commit()
-    db.refresh(obj)
+    invalidate_error_types()
     return obj
 
 
@@ -164,15 +184,9 @@ def update_error_type(
         if value is not None:
             setattr(obj, key, value)
     if category_changed and payload.sort_order is None:
-        max_query = db.query(func.max(ErrorType.sort_order))
-        if category_en is None:
-            max_query = max_query.filter(ErrorType.category_en.is_(None))
-        else:
-            max_query = max_query.filter(ErrorType.category_en == category_en)
-        max_order = max_query.scalar() or 0
-        obj.sort_order = max_order + 1
+        obj.sort_order = db.scalar(select(_next_sort_order(category_en)))
     db.commit()
-    db.refresh(obj)
+    invalidate_error_types()
     return obj
 
 
@@ -183,26 +197,30 @@ def upsert_preferences(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    error_type = db.get(ErrorType, error_type_id)
-    if not error_type:
+    values = {
+        "color": payload.color,
+        "hotkey": payload.hotkey,
+        "custom_name": payload.custom_name,
+    }
+    is_postgres = db.get_bind().dialect.name == "postgresql"
+    # SQLite does not enforce foreign keys here, so the missing-type check cannot be left
+    # to the IntegrityError below.
+    if not is_postgres and db.get(ErrorType, error_type_id) is None:
         raise HTTPException(status_code=404, detail="Error type not found")
-    pref = (
-        db.query(UserErrorType)
-        .filter(
-            UserErrorType.error_type_id == error_type_id,
-            UserErrorType.user_id == current_user.id,
-        )
-        .one_or_none()
+    # One INSERT ... ON CONFLICT round trip; the user/error-type unique constraint makes
+    # concurrent first saves converge on a single row instead of failing.
+    dialect_insert = postgresql_insert if is_postgres else sqlite_insert
+    stmt = (
+        dialect_insert(UserErrorType)
+        .values(error_type_id=error_type_id, user_id=current_user.id, **values)
+        .on_conflict_do_update(index_elements=["user_id", "error_type_id"], set_=values)
+        .returning(UserErrorType.color, UserErrorType.hotkey, UserErrorType.custom_name)
     )
-    if not pref:
-        pref = UserErrorType(
-            error_type_id=error_type_id,
-            user_id=current_user.id,
-        )
-        db.add(pref)
-    pref.color = payload.color
-    pref.hotkey = payload.hotkey
-    pref.custom_name = payload.custom_name
+    try:
+        row = db.execute(stmt).one()
+    except IntegrityError:
+        # The only constraint left to violate is the error type foreign key.
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Error type not found")
     db.commit()
-    db.refresh(pref)
-    return ErrorTypePreference(color=pref.color, hotkey=pref.hotkey, custom_name=pref.custom_name)
+    return ErrorTypePreference(color=row.color, hotkey=row.hotkey, custom_name=row.custom_name)
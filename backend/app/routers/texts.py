@@ -8,14 +8,18 @@ import hashlib
 import json
 import logging
 import re
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, timezone
-from itertools import combinations
-from typing import Iterable
+from functools import lru_cache
+from itertools import chain, combinations
+from typing import Iterable, Iterator, Sequence
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import PlainTextResponse
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Query as OrmQuery, Session, defer, joinedload, raiseload, selectinload
 from sqlalchemy.orm.exc import StaleDataError
 from pydantic import BaseModel
 
@@ -46,47 +50,100 @@ from ..schemas.common import (
     TextRead,
 )
 from ..services.auth import get_current_user, get_db
+from ..services.cache import TTLCache
+from ..services.caches import (
+    invalidate_category_stats,
+    invalidate_dashboard_stats,
+    invalidate_error_types,
+)
 
 router = APIRouter(prefix="/api/texts", tags=["texts"])
 LOCK_DURATION = timedelta(minutes=30)
+# Texts per INSERT statement on import; keeps bound parameters well under driver limits.
+IMPORT_BATCH_SIZE = 1000
+# Tasks fetched, and texts rendered, per round trip while streaming the bulk export.
+EXPORT_BATCH_SIZE = 200
+# Task statuses after which a text is no longer handed out, and text states that still are.
+TERMINAL_TASK_STATUSES = ("submitted", "skip", "trash")
+ASSIGNABLE_TEXT_STATES = ("pending", "in_annotation")
 logger = logging.getLogger(__name__)
 
+# Corrected-text renders keyed by (source digest, annotations digest).
+_render_cache = TTLCache(ttl=600, maxsize=1024)
+
+
+def _invalidate_counters() -> None:
+    """Drop cached category and dashboard counters after text, task, or flag states change."""
+    invalidate_category_stats()
+    invalidate_dashboard_stats()
+
+
+def _dialect_insert(db: Session):
+    """insert() construct with ON CONFLICT support for the session's backend."""
+    return postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
 
+@lru_cache(maxsize=1024)
 def _sha256_text(text: str) -> str:
+    # Autosaves and submits re-hash the same source text on every request; a hit costs a
+    # string comparison instead of an encode plus digest.
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def _sha256_tokens(tokens: list[str]) -> str:
-    joined = "\u241f".join(tokens)  # unit separator to minimize collision with token text
-    return _sha256_text(joined)
+_TOKEN_SEPARATOR = "\u241f".encode("utf-8")  # unit separator to minimize collision with token text
 
 
-def _get_or_create_noop_error_type(db: Session) -> ErrorType:
+def _sha256_tokens(tokens: list[str]) -> str:
+    # Streams the tokens into the digest; equal to hashing "\u241f".join(tokens), which the
+    # editor computes on its side, without materializing the joined copy.
+    digest = hashlib.sha256()
+    for index, token in enumerate(tokens):
+        if index:
+            digest.update(_TOKEN_SEPARATOR)
+        digest.update(token.encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Id of the "noop" error type once it has been looked up; a primary-key get replaces the
+# case-insensitive name scan on later submissions.
+_noop_error_type_cache: dict[str, int] = {}
+
+
+def _get_or_create_noop_error_type(db: Session) -> tuple[ErrorType, bool]:
+    """Return the "noop" error type and whether this call created it."""
+    cached_id = _noop_error_type_cache.get("id")
+    if cached_id is not None:
+        noop = db.get(ErrorType, cached_id)
+        if noop and (noop.en_name or "").lower() == "noop":
+            return noop, False
     noop = (
         db.query(ErrorType)
         .filter(func.lower(ErrorType.en_name) == "noop")
         .one_or_none()
     )
-    if noop:
-        return noop
-    noop = ErrorType(en_name="noop", default_color="#94a3b8", is_active=True)
-    db.add(noop)
-    db.flush()
-    return noop
+    created = noop is None
+    if created:
+        noop = ErrorType(en_name="noop", default_color="#94a3b8", is_active=True)
+        db.add(noop)
+        db.flush()
+    _noop_error_type_cache["id"] = noop.id
+    return noop, created
+
+
+# A comma/whitespace-delimited item made only of digits; other items are ignored.
+_INT_CSV_ITEM = re.compile(r"(?<![^,\s])\d+(?![^,\s])")
 
 
 def _parse_int_list(raw: str | None) -> list[int]:
     if not raw:
         return []
-    parsed: list[int] = []
-    for chunk in raw.split(","):
-        chunk = chunk.strip()
-        if chunk.isdigit():
-            parsed.append(int(chunk))
-    return parsed
+    return list(map(int, _INT_CSV_ITEM.findall(raw)))
 
 
 def _annotation_payload_to_dict(item: AnnotationPayload | dict) -> dict:
+    if isinstance(item, dict) and isinstance(item.get("payload"), dict):
+        # Already plain data; callers only read from it, so skip the copy.
+        return item
     if isinstance(item, BaseModel):
         data = item.model_dump()
     else:
@@ -130,66 +187,69 @@ def import_texts(
     if not normalized:
         raise HTTPException(status_code=400, detail="No texts provided")
 
-    external_ids = [str(entry["ext_id"]) for entry in normalized if entry.get("ext_id")]
-    existing_ids: set[str] = set()
-    if external_ids:
-        rows = (
-            db.query(TextSample.external_id)
-            .filter(TextSample.category_id == category.id, TextSample.external_id.in_(external_ids))
-            .all()
+    # Repeats inside the payload keep their first occurrence; texts already in the category
+    # are skipped by the database through the (category_id, external_id) unique index.
+    by_ext_id: dict[str, dict[str, object]] = {}
+    for entry in normalized:
+        by_ext_id.setdefault(str(entry["ext_id"]), entry)
+
+    # A text imported with annotations gets exactly one submitted task, so it is complete
+    # right away whenever a single annotation is required.
+    completed_state = "awaiting_cross_validation" if request.required_annotations <= 1 else "pending"
+    text_rows = [
+        {
+            "content": entry["body"],
+            "tokens_cache": _build_tokens_cache(entry["body"]),
+            "external_id": ext_id,
+            "category_id": category.id,
+            "required_annotations": request.required_annotations,
+            "state": completed_state if entry.get("annotations") else "pending",
+        }
+        for ext_id, entry in by_ext_id.items()
+    ]
+    dialect_insert = _dialect_insert(db)
+    created: list[tuple[int, dict[str, object]]] = []
+    for batch_start in range(0, len(text_rows), IMPORT_BATCH_SIZE):
+        stmt = (
+            dialect_insert(TextSample)
+            .values(text_rows[batch_start : batch_start + IMPORT_BATCH_SIZE])
+            .on_conflict_do_nothing(index_elements=["category_id", "external_id"])
+            .returning(TextSample.id, TextSample.external_id)
         )
-        existing_ids = {row[0] for row in rows if row[0]}
+        created.extend((row.id, by_ext_id[row.external_id]) for row in db.execute(stmt))
 
-    seen: set[str] = set()
-    inserted = 0
-    for entry in normalized:
-        body = entry["body"]
-        ext_id = entry.get("ext_id")
-        ext_id_value = str(ext_id) if ext_id is not None else None
+    task_rows: list[dict] = []
+    annotation_rows: list[dict] = []
+    for text_id, entry in created:
         annotations = entry.get("annotations") or []
-        # skip duplicates by external_id (either already in DB or repeated in payload)
-        if ext_id and (ext_id in existing_ids or ext_id in seen):
+        if not annotations:
             continue
-        if ext_id:
-            seen.add(ext_id)
-        text = TextSample(
-            content=body,
-            external_id=ext_id_value,  # type: ignore[arg-type]
-            category_id=category.id,
-            required_annotations=request.required_annotations,
-        )
-        db.add(text)
-        db.flush()
-        if annotations:
-            task = AnnotationTask(text_id=text.id, annotator_id=current_user.id, status="submitted")
-            db.add(task)
-            for item in annotations:
-                item_data = _annotation_payload_to_dict(item)
-                payload = item_data.get("payload") or {}
-                db.add(
-                    Annotation(
-                        text_id=text.id,
-                        author_id=current_user.id,
-                        start_token=item_data.get("start_token", 0),
-                        end_token=item_data.get("end_token", 0),
-                        replacement=item_data.get("replacement"),
-                        error_type_id=item_data.get("error_type_id"),
-                        payload=payload,
-                    )
-                )
-            completed_count = (
-                db.query(AnnotationTask)
-                .filter(AnnotationTask.text_id == text.id, AnnotationTask.status == "submitted")
-                .count()
+        task_rows.append({"text_id": text_id, "annotator_id": current_user.id, "status": "submitted"})
+        for item in annotations:
+            item_data = _annotation_payload_to_dict(item)
+            annotation_rows.append(
+                {
+                    "text_id": text_id,
+                    "author_id": current_user.id,
+                    "start_token": item_data.get("start_token", 0),
+                    "end_token": item_data.get("end_token", 0),
+                    "replacement": item_data.get("replacement"),
+                    "error_type_id": item_data.get("error_type_id"),
+                    "payload": item_data.get("payload") or {},
+                }
             )
-            if completed_count >= text.required_annotations:
-                text.state = "awaiting_cross_validation"
-                _queue_cross_validation(db=db, text_id=text.id)
-            else:
-                text.state = "pending"
-        inserted += 1
+    if task_rows:
+        db.execute(insert(AnnotationTask), task_rows)
+        if completed_state == "awaiting_cross_validation":
+            db.execute(
+                insert(CrossValidationResult),
+                [{"text_id": row["text_id"], "status": "pending", "result": {}} for row in task_rows],
+            )
+    if annotation_rows:
+        db.execute(insert(Annotation), annotation_rows)
     db.commit()
-    return TextImportResponse(inserted=inserted)
+    _invalidate_counters()
+    return TextImportResponse(inserted=len(created))
 
 
 @router.post("/assignments/next", response_model=TextAssignmentResponse)
@@ -211,22 +271,19 @@ def get_next_text(
     )
 
     skipped_subquery = select(SkippedText.text_id).where(SkippedText.annotator_id == current_user.id)
-    any_task_for_user = select(AnnotationTask.text_id).where(AnnotationTask.annotator_id == current_user.id)
-    submitted_subquery = select(AnnotationTask.text_id).where(
-        AnnotationTask.annotator_id == current_user.id, AnnotationTask.status == "submitted"
-    )
 
-    terminal_statuses = ("submitted", "skip", "trash")
-    terminal_texts_subq = select(AnnotationTask.text_id).where(AnnotationTask.status.in_(terminal_statuses))
+    terminal_texts_subq = select(AnnotationTask.text_id).where(
+        AnnotationTask.status.in_(TERMINAL_TASK_STATUSES)
+    )
 
     existing_task_row = (
         db.query(AnnotationTask, TextSample)
         .join(TextSample, AnnotationTask.text_id == TextSample.id)
         .filter(
             AnnotationTask.annotator_id == current_user.id,
-            AnnotationTask.status.notin_(terminal_statuses),
+            AnnotationTask.status.notin_(TERMINAL_TASK_STATUSES),
             TextSample.category_id == category_id,
-            TextSample.state.in_(["pending", "in_annotation"]),
+            TextSample.state.in_(ASSIGNABLE_TEXT_STATES),
             ~AnnotationTask.text_id.in_(skipped_subquery),
             ~TextSample.id.in_(terminal_texts_subq),
         )
@@ -245,34 +302,47 @@ def get_next_text(
 
         annotations = (
             db.query(Annotation)
+            .options(raiseload("*"))
             .filter(Annotation.text_id == text.id, Annotation.author_id == current_user.id)
             .all()
         )
         db.commit()
+        _invalidate_counters()
         return TextAssignmentResponse(text=text, annotations=annotations, lock_expires_at=now + LOCK_DURATION)
 
-    submitted_count_subq = (
-        select(func.count())
-        .select_from(AnnotationTask)
-        .where(AnnotationTask.text_id == TextSample.id, AnnotationTask.status == "submitted")
-        .correlate(TextSample)
-        .scalar_subquery()
+    # A text is offered only if this user never flagged or took it and nobody has finished it
+    # yet. Any submitted task is terminal, so every candidate has zero submissions and the
+    # required-count check reduces to required_annotations > 0. Both probes are NOT EXISTS
+    # lookups that the (text_id, ...) indexes answer per candidate row.
+    flagged_by_user = (
+        select(SkippedText.id)
+        .where(SkippedText.text_id == TextSample.id, SkippedText.annotator_id == current_user.id)
+        .exists()
+    )
+    taken_or_finished = (
+        select(AnnotationTask.id)
+        .where(
+            AnnotationTask.text_id == TextSample.id,
+            or_(
+                AnnotationTask.annotator_id == current_user.id,
+                AnnotationTask.status.in_(TERMINAL_TASK_STATUSES),
+            ),
+        )
+        .exists()
     )
 
     stmt = (
         select(TextSample)
         .where(
             TextSample.category_id == category_id,
-            TextSample.state.in_(["pending", "in_annotation"]),
-            ~TextSample.id.in_(skipped_subquery),
-            ~TextSample.id.in_(any_task_for_user),
-            ~TextSample.id.in_(submitted_subquery),
-            ~TextSample.id.in_(terminal_texts_subq),
+            TextSample.state.in_(ASSIGNABLE_TEXT_STATES),
+            TextSample.required_annotations > 0,
+            ~flagged_by_user,
+            ~taken_or_finished,
             or_(
                 TextSample.locked_by_id.is_(None),
                 TextSample.locked_by_id == current_user.id,
             ),
-            submitted_count_subq < TextSample.required_annotations,
         )
         .order_by(TextSample.id)
         .with_for_update(skip_locked=True)
@@ -284,24 +354,18 @@ def get_next_text(
     text.locked_by_id = current_user.id
     text.locked_at = now
     text.state = "in_annotation"
-    db.flush()
-
-    task = (
-        db.query(AnnotationTask)
-        .filter(AnnotationTask.text_id == text.id, AnnotationTask.annotator_id == current_user.id)
-        .one_or_none()
-    )
-    if not task:
-        task = AnnotationTask(text_id=text.id, annotator_id=current_user.id)
-        db.add(task)
-        db.flush()
+    # Candidates never have a task for this user (see taken_or_finished), so the task is
+    # always new; it is written together with the lock on commit.
+    db.add(AnnotationTask(text_id=text.id, annotator_id=current_user.id))
 
     annotations = (
         db.query(Annotation)
+        .options(raiseload("*"))
         .filter(Annotation.text_id == text.id, Annotation.author_id == current_user.id)
         .all()
     )
     db.commit()
+    _invalidate_counters()
     return TextAssignmentResponse(text=text, annotations=annotations, lock_expires_at=now + LOCK_DURATION)
 
 
@@ -312,7 +376,9 @@ def list_annotations(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    query = db.query(Annotation).filter(Annotation.text_id == text_id)
+    # AnnotationRead only reads columns; raiseload turns any future relationship access
+    # during serialization into an error instead of one lazy SELECT per annotation.
+    query = db.query(Annotation).options(raiseload("*")).filter(Annotation.text_id == text_id)
     if not all_authors:
         query = query.filter(Annotation.author_id == current_user.id)
     return query.order_by(Annotation.id).all()
@@ -328,10 +394,117 @@ def render_annotations(
     text = db.get(TextSample, text_id)
     if not text:
         raise HTTPException(status_code=404, detail="Text not found")
-    corrected = _render_corrected_text(text.content or "", request.annotations)
+    source = text.content or ""
+    # Rendering is a pure function of the source text and the annotations, so the key is
+    # their digests; the editor re-renders unchanged states often while navigating.
+    key = (_sha256_text(source), hashlib.sha256(request.model_dump_json().encode("utf-8")).digest())
+    corrected = _render_cache.get_or_set(
+        key, lambda: _render_corrected_text(source, request.annotations)
+    )
     return AnnotationRenderResponse(corrected_text=corrected)
 
 
+def _summarize_annotations(items: list[AnnotationPayload]):
+    summary = []
+    for ann in items[:5]:
+        payload = ann.payload
+        op = None
+        before = None
+        after = None
+        text_hash = None
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump()
+        if isinstance(payload, dict):
+            op = payload.get("operation")
+            before = len(payload.get("before_tokens") or [])
+            after_tokens = payload.get("after_tokens") or []
+            after = len(after_tokens)
+            text_hash = payload.get("text_sha256") or payload.get("text_hash")
+        summary.append(
+            {
+                "start": ann.start_token,
+                "end": ann.end_token,
+                "op": op,
+                "before_len": before,
+                "after_len": after,
+                "hash": text_hash,
+                "has_id": getattr(ann, "id", None) is not None,
+            }
+        )
+    return summary
+
+
+def _ensure_payload_dict(raw: BaseModel | dict | None) -> dict:
+    if isinstance(raw, BaseModel):
+        return raw.model_dump()
+    return dict(raw or {})
+
+
+def _validate_payload(payload: dict):
+    op = payload.get("operation")
+    if op not in {"replace", "delete", "insert", "move", "noop"}:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid operation")
+    after_tokens = payload.get("after_tokens", [])
+    if not isinstance(after_tokens, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="after_tokens must be a list")
+    for token in after_tokens:
+        if not isinstance(token, dict):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="after_tokens must contain objects")
+        if "id" not in token or "text" not in token:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="after_tokens entries must include id and text",
+            )
+        origin = token.get("origin")
+        if origin not in {"base", "inserted"}:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="after_tokens origin must be 'base' or 'inserted'",
+            )
+    before_tokens = payload.get("before_tokens", [])
+    if not isinstance(before_tokens, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="before_tokens must be a list")
+
+
+def _normalize_token_fragment(token: object) -> tuple:
+    if isinstance(token, dict):
+        return (
+            str(token.get("id")) if token.get("id") is not None else None,
+            str(token.get("text") or ""),
+            token.get("origin"),
+            token.get("space_before", token.get("spaceBefore")),
+            token.get("source_id", token.get("sourceId")),
+        )
+    return (
+        str(getattr(token, "id", None)) if getattr(token, "id", None) is not None else None,
+        str(getattr(token, "text", "") or ""),
+        getattr(token, "origin", None),
+        getattr(token, "space_before", getattr(token, "spaceBefore", None)),
+        getattr(token, "source_id", getattr(token, "sourceId", None)),
+    )
+
+
+def _payload_signature(payload: dict, replacement: str | None) -> tuple:
+    op = payload.get("operation") or ("replace" if replacement else "noop")
+    before_tokens = payload.get("before_tokens")
+    if not isinstance(before_tokens, list):
+        before_tokens = []
+    after_tokens = payload.get("after_tokens")
+    if not isinstance(after_tokens, list):
+        after_tokens = []
+    move_from = payload.get("move_from", payload.get("moveFrom"))
+    move_to = payload.get("move_to", payload.get("moveTo"))
+    move_len = payload.get("move_len", payload.get("moveLen"))
+    return (
+        op,
+        tuple(str(tok) for tok in before_tokens),
+        tuple(_normalize_token_fragment(tok) for tok in after_tokens),
+        move_from,
+        move_to,
+        move_len,
+    )
+
+
 @router.post("/{text_id}/annotations", response_model=list[AnnotationRead])
 def save_annotations(
     text_id: int,
@@ -339,124 +512,27 @@ def save_annotations(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    def _summarize_annotations(items: list[AnnotationPayload]):
-        summary = []
-        for ann in items[:5]:
-            payload = ann.payload
-            op = None
-            before = None
-            after = None
-            text_hash = None
-            if isinstance(payload, BaseModel):
-                payload = payload.model_dump()
-            if isinstance(payload, dict):
-                op = payload.get("operation")
-                before = len(payload.get("before_tokens") or [])
-                after_tokens = payload.get("after_tokens") or []
-                after = len(after_tokens)
-                text_hash = payload.get("text_sha256") or payload.get("text_hash")
-            summary.append(
-                {
-                    "start": ann.start_token,
-                    "end": ann.end_token,
-                    "op": op,
-                    "before_len": before,
-                    "after_len": after,
-                    "hash": text_hash,
-                    "has_id": getattr(ann, "id", None) is not None,
-                }
-            )
-        return summary
-
     text = db.get(TextSample, text_id)
     if not text:
         raise HTTPException(status_code=404, detail="Text not found")
 
     try:
-        existing = (
-            db.query(Annotation)
-            .filter(Annotation.text_id == text_id, Annotation.author_id == current_user.id)
-            .all()
-        )
-        server_version = max((ann.version for ann in existing), default=0)
         client_version = request.client_version or 0
-        if client_version and client_version < server_version:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Client version is stale. Reload annotations before saving.",
+        if client_version:
+            # Stale clients are rejected before any annotation rows are loaded.
+            server_version = (
+                db.query(func.max(Annotation.version))
+                .filter(Annotation.text_id == text_id, Annotation.author_id == current_user.id)
+                .scalar()
+                or 0
             )
-        text_hash = _sha256_text(text.content)
-
-        def _ensure_payload_dict(raw: BaseModel | dict | None) -> dict:
-            if isinstance(raw, BaseModel):
-                return raw.model_dump()
-            return dict(raw or {})
-
-        def _validate_payload(payload: dict):
-            op = payload.get("operation")
-            if op not in {"replace", "delete", "insert", "move", "noop"}:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid operation")
-            after_tokens = payload.get("after_tokens", [])
-            if not isinstance(after_tokens, list):
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="after_tokens must be a list")
-            for token in after_tokens:
-                if not isinstance(token, dict):
-                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="after_tokens must contain objects")
-                if "id" not in token or "text" not in token:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="after_tokens entries must include id and text",
-                    )
-                origin = token.get("origin")
-                if origin not in {"base", "inserted"}:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="after_tokens origin must be 'base' or 'inserted'",
-                    )
-            before_tokens = payload.get("before_tokens", [])
-            if not isinstance(before_tokens, list):
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="before_tokens must be a list")
-
-        def _normalize_token_fragment(token: object) -> tuple:
-            if isinstance(token, dict):
-                return (
-                    str(token.get("id")) if token.get("id") is not None else None,
-                    str(token.get("text") or ""),
-                    token.get("origin"),
-                    token.get("space_before", token.get("spaceBefore")),
-                    token.get("source_id", token.get("sourceId")),
+            if client_version < server_version:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Client version is stale. Reload annotations before saving.",
                 )
-            return (
-                str(getattr(token, "id", None)) if getattr(token, "id", None) is not None else None,
-                str(getattr(token, "text", "") or ""),
-                getattr(token, "origin", None),
-                getattr(token, "space_before", getattr(token, "spaceBefore", None)),
-                getattr(token, "source_id", getattr(token, "sourceId", None)),
-            )
-
-        def _payload_signature(payload: dict, replacement: str | None) -> tuple:
-            op = payload.get("operation") or ("replace" if replacement else "noop")
-            before_tokens = payload.get("before_tokens")
-            if not isinstance(before_tokens, list):
-                before_tokens = []
-            after_tokens = payload.get("after_tokens")
-            if not isinstance(after_tokens, list):
-                after_tokens = []
-            move_from = payload.get("move_from", payload.get("moveFrom"))
-            move_to = payload.get("move_to", payload.get("moveTo"))
-            move_len = payload.get("move_len", payload.get("moveLen"))
-            return (
-                op,
-                tuple(str(tok) for tok in before_tokens),
-                tuple(_normalize_token_fragment(tok) for tok in after_tokens),
-                move_from,
-                move_to,
-                move_len,
-            )
-
-        saved: list[Annotation] = []
         deleted_ids = set(request.deleted_ids or [])
-        # Process deletions first
+        # Process deletions first, so the rows loaded below never include removed annotations.
         if deleted_ids:
             (
                 db.query(Annotation)
@@ -466,29 +542,67 @@ def save_annotations(
                 )
                 .delete(synchronize_session=False)
             )
-            existing = [ann for ann in existing if ann.id not in deleted_ids]
+        # Payload JSON is the bulk of each row; it is only ever overwritten for the author's
+        # own annotations, and other authors' payloads are fetched below only when compared.
+        existing = (
+            db.query(Annotation)
+            .options(defer(Annotation.payload))
+            .filter(Annotation.text_id == text_id, Annotation.author_id == current_user.id)
+            .all()
+        )
+        text_hash = _sha256_text(text.content)
 
-        # Refresh mappings after deletions so we don't upsert against removed rows.
-        if deleted_ids:
-            existing = (
-                db.query(Annotation)
-                .filter(Annotation.text_id == text_id, Annotation.author_id == current_user.id)
-                .all()
-            )
+        saved: list[Annotation | None] = []
+        # New annotations are inserted together after the loop; their slots in ``saved``
+        # are filled from the RETURNING rows so the response keeps the request order.
+        new_rows: list[dict] = []
+        new_slots: list[int] = []
         existing_by_id = {annotation.id: annotation for annotation in existing}
         existing_by_span = {(annotation.start_token, annotation.end_token): annotation for annotation in existing}
+        # Loaded in id order so each span group below is already sorted oldest first.
         other_existing = (
             db.query(Annotation)
+            .options(defer(Annotation.payload))
             .filter(Annotation.text_id == text_id, Annotation.author_id != current_user.id)
+            .order_by(Annotation.id)
             .all()
         )
         other_by_id = {annotation.id: annotation for annotation in other_existing}
         other_by_span: dict[tuple[int, int], list[Annotation]] = {}
         for annotation in other_existing:
             other_by_span.setdefault((annotation.start_token, annotation.end_token), []).append(annotation)
-        for group in other_by_span.values():
-            group.sort(key=lambda ann: ann.id)
-
+        # Signatures of the other authors' annotations, built in one query the first time an
+        # item's replacement and error type match one of them; entries are refreshed when an
+        # annotation is taken over.
+        other_sigs: dict[int, tuple] = {}
+
+        def _other_signature(candidate: Annotation) -> tuple:
+            if candidate.id not in other_sigs:
+                missing = [ann.id for ann in other_existing if ann.id not in other_sigs]
+                rows = db.query(Annotation.id, Annotation.payload, Annotation.replacement).filter(
+                    Annotation.id.in_(missing)
+                )
+                for row in rows:
+                    other_sigs[row.id] = _payload_signature(
+                        _ensure_payload_dict(row.payload), row.replacement
+                    )
+            return other_sigs[candidate.id]
+
+        def _annotation_matches(
+            candidate: Annotation,
+            expected_sig: tuple,
+            expected_replacement: str | None,
+            expected_error_type: int,
+        ) -> bool:
+            if (candidate.replacement or None) != (expected_replacement or None):
+                return False
+            if candidate.error_type_id != expected_error_type:
+                return False
+            return _other_signature(candidate) == expected_sig
+
+        # Snapshot used for items that arrive without text_tokens; the same for every item.
+        default_tokens: list[str] | None = None
+        default_tokens_sha256: str | None = None
         for item in request.annotations:
             if item.id and item.id in deleted_ids:
                 continue
@@ -507,9 +621,11 @@ def save_annotations(
                 or not isinstance(payload.get("text_tokens"), list)
                 or len(payload.get("text_tokens") or []) == 0
             ):
-                tokens_snapshot = text.content.split()
-                payload["text_tokens"] = tokens_snapshot
-                payload["text_tokens_sha256"] = _sha256_tokens(tokens_snapshot)
+                if default_tokens is None:
+                    default_tokens = text.content.split()
+                    default_tokens_sha256 = _sha256_tokens(default_tokens)
+                payload["text_tokens"] = default_tokens
+                payload["text_tokens_sha256"] = default_tokens_sha256
             elif not payload.get("text_tokens_sha256"):
                 payload["text_tokens_sha256"] = _sha256_tokens([str(t) for t in payload["text_tokens"]])
 
@@ -529,20 +645,6 @@ def save_annotations(
             if payload.get("operation") == "noop":
                 replacement = replacement or None
 
-            def _annotation_matches(
-                candidate: Annotation,
-                expected_sig: tuple,
-                expected_replacement: str | None,
-                expected_error_type: int,
-            ) -> bool:
-                if (candidate.replacement or None) != (expected_replacement or None):
-                    return False
-                if candidate.error_type_id != expected_error_type:
-                    return False
-                candidate_payload = _ensure_payload_dict(candidate.payload)
-                candidate_sig = _payload_signature(candidate_payload, candidate.replacement)
-                return candidate_sig == expected_sig
-
             annotation = None
             if item.id:
                 annotation = existing_by_id.get(item.id)
@@ -584,38 +686,52 @@ def save_annotations(
                     other_annotation.payload = payload
                     other_annotation.error_type_id = item.error_type_id
                     other_annotation.version += 1
+                    other_sigs[other_annotation.id] = payload_sig
                     annotation = other_annotation
                     existing_by_id[annotation.id] = annotation
                     existing_by_span[(annotation.start_token, annotation.end_token)] = annotation
                 else:
-                    annotation = Annotation(
-                        text_id=text_id,
-                        author_id=current_user.id,
-                        start_token=item.start_token,
-                        end_token=item.end_token,
-                        replacement=replacement,
-                        payload=payload,
-                        error_type_id=item.error_type_id,
+                    new_slots.append(len(saved))
+                    new_rows.append(
+                        {
+                            "text_id": text_id,
+                            "author_id": current_user.id,
+                            "start_token": item.start_token,
+                            "end_token": item.end_token,
+                            "replacement": replacement,
+                            "payload": payload,
+                            "error_type_id": item.error_type_id,
+                        }
                     )
-                    db.add(annotation)
+                    saved.append(None)
+                    continue
                 saved.append(annotation)
 
         db.flush()
+        if new_rows:
+            created = db.scalars(
+                insert(Annotation).returning(Annotation, sort_by_parameter_order=True), new_rows
+            ).all()
+            for slot, annotation in zip(new_slots, created):
+                saved[slot] = annotation
         # Persist snapshots for rollback/history
-        for ann in saved:
-            snapshot = {
-                "start_token": ann.start_token,
-                "end_token": ann.end_token,
-                "replacement": ann.replacement,
-                "payload": ann.payload,
-                "error_type_id": ann.error_type_id,
-            }
-            db.add(
-                AnnotationVersion(
-                    annotation_id=ann.id,
-                    version=ann.version,
-                    snapshot=snapshot,
-                )
+        if saved:
+            db.execute(
+                insert(AnnotationVersion),
+                [
+                    {
+                        "annotation_id": ann.id,
+                        "version": ann.version,
+                        "snapshot": {
+                            "start_token": ann.start_token,
+                            "end_token": ann.end_token,
+                            "replacement": ann.replacement,
+                            "payload": ann.payload,
+                            "error_type_id": ann.error_type_id,
+                        },
+                    }
+                    for ann in saved
+                ],
             )
 
         db.commit()
@@ -690,9 +806,11 @@ def submit_annotations(
         .filter(Annotation.text_id == text_id, Annotation.author_id == current_user.id)
         .all()
     )
+    created_noop_type = False
     if not existing_annotations:
         tokens_snapshot = text.content.split()
-        noop_type = _get_or_create_noop_error_type(db)
+        # A newly created noop type changes the cached error type list once committed.
+        noop_type, created_noop_type = _get_or_create_noop_error_type(db)
         payload = {
             "operation": "noop",
             "before_tokens": [],
@@ -727,19 +845,30 @@ def submit_annotations(
             )
         )
 
-    db.flush()
-    completed_count = (
-        db.query(AnnotationTask)
-        .filter(AnnotationTask.text_id == text_id, AnnotationTask.status == "submitted")
-        .count()
-    )
-    if completed_count >= text.required_annotations:
+    # This task is now submitted, so only the other annotators' submissions need counting,
+    # and none at all when a single annotation completes the text.
+    completed = text.required_annotations <= 1
+    if not completed:
+        other_submitted = db.scalar(
+            select(func.count())
+            .select_from(AnnotationTask)
+            .where(
+                AnnotationTask.text_id == text_id,
+                AnnotationTask.status == "submitted",
+                AnnotationTask.annotator_id != current_user.id,
+            )
+        )
+        completed = other_submitted + 1 >= text.required_annotations
+    if completed:
         text.state = "awaiting_cross_validation"
         _queue_cross_validation(db=db, text_id=text_id)
     else:
         # Return the text to the queue for other annotators if more submissions are needed.
         text.state = "pending"
     db.commit()
+    _invalidate_counters()
+    if created_noop_type:
+        invalidate_error_types()
     return {"status": "submitted"}
 
 
@@ -750,8 +879,18 @@ def _flag_text(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> None:
-    text = db.get(TextSample, text_id)
-    if not text:
+    # Make the text unavailable for further assignment until restored.
+    flagged_text_id = db.execute(
+        update(TextSample)
+        .where(TextSample.id == text_id)
+        .values(
+            locked_by_id=None,
+            locked_at=None,
+            state="trash" if flag_type == "trash" else "skipped",
+        )
+        .returning(TextSample.id)
+    ).scalar_one_or_none()
+    if flagged_text_id is None:
         raise HTTPException(status_code=404, detail="Text not found")
 
     # Remove opposite flag types for this user/text to keep the latest flag exclusive.
@@ -765,49 +904,29 @@ def _flag_text(
         .delete(synchronize_session=False)
     )
 
-    skip = (
-        db.query(SkippedText)
-        .filter(
-            SkippedText.text_id == text_id,
-            SkippedText.annotator_id == current_user.id,
-            SkippedText.flag_type == flag_type,
-        )
-        .one_or_none()
-    )
-    if skip:
-        skip.reason = payload.reason
-        skip.flag_type = flag_type
-    else:
-        skip = SkippedText(
+    # Re-flagging only refreshes the reason; uniq_skipped_text is the conflict target.
+    db.execute(
+        _dialect_insert(db)(SkippedText)
+        .values(
             text_id=text_id,
             annotator_id=current_user.id,
             reason=payload.reason,
             flag_type=flag_type,
         )
-        db.add(skip)
-
-    if text.locked_by_id == current_user.id:
-        text.locked_by_id = None
-        text.locked_at = None
-
-    task = (
-        db.query(AnnotationTask)
-        .filter(AnnotationTask.text_id == text_id, AnnotationTask.annotator_id == current_user.id)
-        .one_or_none()
+        .on_conflict_do_update(
+            index_elements=["text_id", "annotator_id", "flag_type"],
+            set_={"reason": payload.reason},
+        )
     )
-    if task:
-        task.status = flag_type
-        task.updated_at = datetime.now(timezone.utc)
 
-    # Make the text unavailable for further assignment until restored.
-    text.locked_by_id = None
-    text.locked_at = None
-    if flag_type == "trash":
-        text.state = "trash"
-    else:  # skip
-        text.state = "skipped"
+    db.execute(
+        update(AnnotationTask)
+        .where(AnnotationTask.text_id == text_id, AnnotationTask.annotator_id == current_user.id)
+        .values(status=flag_type, updated_at=datetime.now(timezone.utc))
+    )
 
     db.commit()
+    _invalidate_counters()
 
 
 def _clear_flag(
@@ -840,6 +959,7 @@ def _clear_flag(
                     text.state = "pending"
         db.delete(skip)
         db.commit()
+        _invalidate_counters()
 
 
 @router.post("/{text_id}/skip", status_code=status.HTTP_204_NO_CONTENT)
@@ -922,25 +1042,28 @@ def list_annotation_history(
     current_user=Depends(get_current_user),
 ):
     rows = (
-        db.query(AnnotationTask, TextSample)
+        db.query(
+            AnnotationTask.text_id,
+            AnnotationTask.status,
+            AnnotationTask.updated_at,
+            # Only the preview leaves the database, not the whole text body.
+            func.substr(TextSample.content, 1, 160).label("preview"),
+        )
         .join(TextSample, AnnotationTask.text_id == TextSample.id)
         .filter(AnnotationTask.annotator_id == current_user.id)
         .order_by(AnnotationTask.updated_at.desc(), AnnotationTask.id.desc())
         .limit(limit)
         .all()
     )
-    history: list[AnnotationHistoryItem] = []
-    for task, text in rows:
-        preview = (text.content or "")[:160]
-        history.append(
-            AnnotationHistoryItem(
-                text_id=text.id,
-                status=task.status,
-                updated_at=task.updated_at or datetime.utcnow(),
-                preview=preview,
-            )
+    return [
+        AnnotationHistoryItem(
+            text_id=row.text_id,
+            status=row.status,
+            updated_at=row.updated_at or datetime.utcnow(),
+            preview=row.preview or "",
         )
-    return history
+        for row in rows
+    ]
 
 
 def _resolve_label(ann: Annotation) -> str:
@@ -980,8 +1103,13 @@ _SPECIAL_TOKEN_SOURCES = [
     r"(https?:\/\/[^\s,;:!]+|www\.[^\s,;:!]+)",
 ]
 _SPECIAL_TOKEN_FULL = [re.compile(rf"^{src}$") for src in _SPECIAL_TOKEN_SOURCES]
-_SPECIAL_TOKEN_MATCHERS = [re.compile(src) for src in _SPECIAL_TOKEN_SOURCES]
-_BASE_REGEX = re.compile(r"(\w+)|[^\w\s]", re.UNICODE)
+# One alternation in the old per-position order (specials, then words, then single
+# punctuation marks), so a single finditer pass replaces trying each matcher at every index.
+_TOKEN_REGEX = re.compile(
+    "(?P<special>" + "|".join(f"(?:{src})" for src in _SPECIAL_TOKEN_SOURCES) + ")"
+    r"|(?P<word>\w+)|(?P<punct>[^\w\s])"
+)
+_TRAILING_PUNCT_REGEX = re.compile(r"[.,;:!?]+$")
 
 
 def _is_punct_only(value: str) -> bool:
@@ -989,7 +1117,7 @@ def _is_punct_only(value: str) -> bool:
 
 
 def _is_special_token(value: str) -> bool:
-    trimmed = re.sub(r"[.,;:!?]+$", "", value or "")
+    trimmed = _TRAILING_PUNCT_REGEX.sub("", value or "")
     if not trimmed:
         return False
     return any(regex.match(trimmed) for regex in _SPECIAL_TOKEN_FULL)
@@ -999,48 +1127,25 @@ def _tokenize_to_tokens(text: str) -> list[dict]:
     tokens: list[dict] = []
     if not text:
         return tokens
-    idx = 0
-    while idx < len(text):
-        had_space = False
-        while idx < len(text) and text[idx].isspace():
-            had_space = True
-            idx += 1
-        if idx >= len(text):
-            break
-        matched = False
-        for matcher in _SPECIAL_TOKEN_MATCHERS:
-            res = matcher.match(text, idx)
-            if not res:
-                continue
-            raw = res.group(0)
-            value = re.sub(r"[.,;:!?]+$", "", raw)
-            advance_by = len(value) or len(raw)
-            if value:
-                tokens.append(
-                    {
-                        "text": value,
-                        "kind": "special",
-                        "space_before": False if not tokens else had_space,
-                    }
-                )
-            idx += advance_by
-            matched = True
-            break
-        if matched:
+    last_end = 0
+    for match in _TOKEN_REGEX.finditer(text):
+        # Only whitespace can sit between matches: every other character matches an alternative.
+        space_before = bool(tokens) and match.start() > last_end
+        last_end = match.end()
+        value = match.group()
+        if match.lastgroup != "special":
+            kind = "punct" if _is_punct_only(value) else "word"
+            tokens.append({"text": value, "kind": kind, "space_before": space_before})
             continue
-        base_match = _BASE_REGEX.match(text, idx)
-        if base_match:
-            value = base_match.group(0)
-            tokens.append(
-                {
-                    "text": value,
-                    "kind": "punct" if _is_punct_only(value) else "word",
-                    "space_before": False if not tokens else had_space,
-                }
-            )
-            idx += len(value)
-            continue
-        idx += 1
+        # Trailing sentence punctuation is not part of a special token; each stripped mark
+        # becomes its own punct token glued to it.
+        trimmed = _TRAILING_PUNCT_REGEX.sub("", value)
+        if trimmed:
+            tokens.append({"text": trimmed, "kind": "special", "space_before": space_before})
+            space_before = False
+        for mark in value[len(trimmed):] if trimmed else ():
+            tokens.append({"text": mark, "kind": "punct", "space_before": space_before})
+            space_before = False
     return tokens
 
 
@@ -1058,6 +1163,20 @@ def _compute_line_breaks(text: str) -> list[int]:
     return breaks
 
 
+@lru_cache(maxsize=1024)
+def _build_tokens_cache(text: str) -> dict:
+    """Base tokens and line breaks stored on TextSample.tokens_cache at ingestion.
+
+    Memoised for texts without a stored cache, whose source is otherwise re-tokenized on
+    every render; the result is shared, so callers must not mutate it (tuples enforce that
+    for the sequences, and _apply_annotations copies each token before editing).
+    """
+    return {
+        "tokens": tuple(_tokenize_to_tokens(text)),
+        "line_breaks": tuple(_compute_line_breaks(text)),
+    }
+
+
 def _build_tokens_from_snapshot(snapshot: list[str], source_text: str) -> list[dict]:
     tokens: list[dict] = []
     cursor = 0
@@ -1085,7 +1204,11 @@ def _build_tokens_from_snapshot(snapshot: list[str], source_text: str) -> list[d
     return tokens
 
 
-def _resolve_tokens_snapshot_for_source(source: str, annotations: Iterable[object]) -> list[dict]:
+def _resolve_tokens_snapshot_for_source(
+    source: str,
+    annotations: Iterable[object],
+    base_tokens: Sequence[dict] | None = None,
+) -> Sequence[dict]:
     snapshot: list[str] | None = None
     for ann in annotations:
         payload = _coerce_payload(getattr(ann, "payload", None))
@@ -1095,11 +1218,14 @@ def _resolve_tokens_snapshot_for_source(source: str, annotations: Iterable[objec
             break
     if snapshot:
         return _build_tokens_from_snapshot(snapshot, source)
+    if base_tokens is not None:
+        return base_tokens
     return _tokenize_to_tokens(source)
 
 
-def _resolve_tokens_snapshot(text: TextSample, annotations: list[Annotation]) -> list[dict]:
-    return _resolve_tokens_snapshot_for_source(text.content or "", annotations)
+def _resolve_tokens_snapshot(text: TextSample, annotations: list[Annotation]) -> Sequence[dict]:
+    cached_tokens = (text.tokens_cache or {}).get("tokens")
+    return _resolve_tokens_snapshot_for_source(text.content or "", annotations, cached_tokens)
 
 
 def _tokenize_edited_text(text: str) -> list[dict]:
@@ -1172,7 +1298,7 @@ def _get_leading_space(tokens: list[dict], index: int) -> bool:
     return tokens[index].get("space_before") is not False
 
 
-def _build_text_from_tokens_with_breaks(tokens: list[dict], breaks: list[int]) -> str:
+def _build_text_from_tokens_with_breaks(tokens: list[dict], breaks: Sequence[int]) -> str:
     break_counts: dict[int, int] = {}
     for idx in breaks:
         break_counts[idx] = break_counts.get(idx, 0) + 1
@@ -1222,12 +1348,8 @@ def _normalize_operation(ann: Annotation) -> str:
     return str(op)
 
 
-def _apply_annotations(tokens: list[dict], annotations: list[Annotation]) -> list[dict]:
+def _apply_annotations(tokens: Sequence[dict], annotations: list[Annotation]) -> list[dict]:
     working = [dict(tok) for tok in tokens]
-    offset_deltas: list[tuple[int, int]] = []
-
-    def offset_at(index: int) -> int:
-        return sum(delta for start, delta in offset_deltas if start <= index)
 
     def clamp_index(idx: int) -> int:
         return max(0, min(len(working), idx))
@@ -1241,6 +1363,25 @@ def _apply_annotations(tokens: list[dict], annotations: list[Annotation]) -> lis
             ann.id or 0,
         ),
     )
+    # Length deltas are keyed by the original start token of each edit. A Fenwick tree over
+    # the sorted distinct starts answers "sum of deltas starting at or before index" in
+    # O(log A) rather than rescanning every recorded delta.
+    delta_starts = sorted({ann.start_token or 0 for ann in sorted_anns})
+    delta_tree = [0] * (len(delta_starts) + 1)
+
+    def add_delta(start: int, delta: int) -> None:
+        pos = bisect_left(delta_starts, start) + 1
+        while pos < len(delta_tree):
+            delta_tree[pos] += delta
+            pos += pos & -pos
+
+    def offset_at(index: int) -> int:
+        pos = bisect_right(delta_starts, index)
+        total = 0
+        while pos:
+            total += delta_tree[pos]
+            pos -= pos & -pos
+        return total
     for ann in sorted_anns:
         payload = _coerce_payload(getattr(ann, "payload", None))
         operation = _normalize_operation(ann)
@@ -1295,13 +1436,20 @@ def _apply_annotations(tokens: list[dict], annotations: list[Annotation]) -> lis
         if operation == "delete":
             new_tokens = []
         working[target_start:target_start + remove_count] = new_tokens
-        offset_deltas.append((start_original, len(new_tokens) - remove_count))
+        add_delta(start_original, len(new_tokens) - remove_count)
     return working
 
 
-def _render_corrected_text(source: str, annotations: Iterable[object]) -> str:
-    base_tokens = _resolve_tokens_snapshot_for_source(source, annotations)
-    line_breaks = _compute_line_breaks(source)
+def _render_corrected_text(
+    source: str,
+    annotations: Iterable[object],
+    tokens_cache: dict | None = None,
+) -> str:
+    # Texts ingested through the import endpoint carry their tokenization; older rows
+    # (tokens_cache is NULL) and ad-hoc renders go through the memoised tokenizer.
+    cache = tokens_cache or _build_tokens_cache(source)
+    base_tokens = _resolve_tokens_snapshot_for_source(source, annotations, cache["tokens"])
+    line_breaks = cache["line_breaks"]
     corrected_tokens = _apply_annotations(base_tokens, annotations)
     return _build_text_from_tokens_with_breaks(corrected_tokens, line_breaks)
 
@@ -1329,7 +1477,7 @@ def _build_export_record(
     annotations: list[Annotation],
 ) -> dict:
     source = text.content or ""
-    target = _render_corrected_text(source, annotations)
+    target = _render_corrected_text(source, annotations, text.tokens_cache)
     edits = [_annotation_to_edit(ann) for ann in sorted(annotations, key=lambda ann: (ann.start_token, ann.end_token, ann.id or 0))]
     return {
         "id": text.id,
@@ -1345,20 +1493,53 @@ def _fetch_annotations_for_tasks(
 ) -> dict[int, list[Annotation]]:
     if not tasks:
         return {}
-    task_ids = [task.id for task in tasks]
-    ann_rows = (
-        db.query(Annotation, AnnotationTask.id)
-        .join(AnnotationTask, AnnotationTask.text_id == Annotation.text_id)
-        .filter(AnnotationTask.id.in_(task_ids), Annotation.author_id == AnnotationTask.annotator_id)
-        .options(joinedload(Annotation.error_type))
+    # One task per (text, annotator) is guaranteed by uniq_task.
+    task_by_author = {(task.text_id, task.annotator_id): task.id for task in tasks}
+    annotations = (
+        db.query(Annotation)
+        .join(
+            AnnotationTask,
+            and_(
+                AnnotationTask.text_id == Annotation.text_id,
+                AnnotationTask.annotator_id == Annotation.author_id,
+            ),
+        )
+        .filter(AnnotationTask.id.in_(list(task_by_author.values())))
+        # Error types are few and shared; one IN query beats repeating them on every row.
+        .options(selectinload(Annotation.error_type))
         .all()
     )
     anns_by_task: dict[int, list[Annotation]] = {task.id: [] for task in tasks}
-    for ann, task_id in ann_rows:
-        anns_by_task.setdefault(task_id, []).append(ann)
+    for ann in annotations:
+        anns_by_task[task_by_author[(ann.text_id, ann.author_id)]].append(ann)
     return anns_by_task
 
 
+def _iter_export_lines(db: Session, task_query: OrmQuery) -> Iterator[str]:
+    """Yield one JSON record per text, reading tasks in batches from a server-side cursor."""
+
+    def render(batch: list[AnnotationTask]) -> Iterator[str]:
+        anns_by_task = _fetch_annotations_for_tasks(db, batch)
+        for task in batch:
+            record = _build_export_record(task.text, anns_by_task.get(task.id) or [])
+            yield json.dumps(record, ensure_ascii=False)
+
+    # Tasks are newest first, so the first one seen per text is the variant that gets exported;
+    # older variants are neither loaded nor rendered.
+    seen_text_ids: set[int] = set()
+    batch: list[AnnotationTask] = []
+    for task in task_query.yield_per(EXPORT_BATCH_SIZE):
+        if task.text_id in seen_text_ids or not task.text:
+            continue
+        seen_text_ids.add(task.text_id)
+        batch.append(task)
+        if len(batch) == EXPORT_BATCH_SIZE:
+            yield from render(batch)
+            batch = []
+    if batch:
+        yield from render(batch)
+
+
 @router.get("/{text_id}/export", response_class=PlainTextResponse)
 def export_single_text(
     text_id: int,
@@ -1368,7 +1549,7 @@ def export_single_text(
     task_query = (
         db.query(AnnotationTask)
         .join(TextSample, AnnotationTask.text_id == TextSample.id)
-        .options(joinedload(AnnotationTask.text))
+        .options(joinedload(AnnotationTask.text).undefer(TextSample.tokens_cache))
         .filter(AnnotationTask.text_id == text_id)
         .filter(AnnotationTask.status == "submitted")
         .filter(TextSample.state.notin_(["trash", "skipped"]))
@@ -1377,19 +1558,14 @@ def export_single_text(
     if not tasks:
         return PlainTextResponse("", media_type="application/x-jsonlines")
 
-    anns_by_task = _fetch_annotations_for_tasks(db, tasks)
     text = tasks[0].text
     if not text:
         return PlainTextResponse("", media_type="application/x-jsonlines")
 
-    variants: list[dict] = []
-    for task in tasks:
-        annotations = anns_by_task.get(task.id) or []
-        variants.append(_build_export_record(text, annotations))
-
-    chosen = variants[0]
-    if len({record["target"] for record in variants}) == 1 and variants:
-        chosen = variants[0]
+    # The most recently submitted variant is exported, so only its annotations are rendered.
+    latest = tasks[0]
+    anns_by_task = _fetch_annotations_for_tasks(db, [latest])
+    chosen = _build_export_record(text, anns_by_task.get(latest.id) or [])
 
     payload = json.dumps(chosen, ensure_ascii=False)
     return PlainTextResponse(payload, media_type="application/x-jsonlines")
@@ -1407,7 +1583,7 @@ def export_submitted_texts(
     task_query = (
         db.query(AnnotationTask)
         .join(TextSample, AnnotationTask.text_id == TextSample.id)
-        .options(joinedload(AnnotationTask.text))
+        .options(joinedload(AnnotationTask.text).undefer(TextSample.tokens_cache))
         .filter(AnnotationTask.status == "submitted")
         .filter(TextSample.state.notin_(["trash", "skipped"]))
     )
@@ -1418,32 +1594,16 @@ def export_submitted_texts(
     if end:
         task_query = task_query.filter(AnnotationTask.updated_at <= end)
 
-    tasks = task_query.order_by(AnnotationTask.updated_at.desc(), AnnotationTask.id.desc()).all()
-    if not tasks:
+    task_query = task_query.order_by(AnnotationTask.updated_at.desc(), AnnotationTask.id.desc())
+    lines = _iter_export_lines(db, task_query)
+    # Rendering the first record up front keeps the empty export a plain empty response.
+    first = next(lines, None)
+    if first is None:
         return PlainTextResponse("", media_type="application/x-jsonlines")
 
-    anns_by_task = _fetch_annotations_for_tasks(db, tasks)
-    tasks_by_text: dict[int, list[AnnotationTask]] = {}
-    for task in tasks:
-        tasks_by_text.setdefault(task.text_id, []).append(task)
-
-    records: list[str] = []
-    for text_id, text_tasks in tasks_by_text.items():
-        text = text_tasks[0].text
-        if not text:
-            continue
-        variants: list[dict] = []
-        for task in text_tasks:
-            annotations = anns_by_task.get(task.id) or []
-            variants.append(_build_export_record(text, annotations))
-        chosen = variants[0]
-        if len({record["target"] for record in variants}) == 1 and variants:
-            chosen = variants[0]
-        records.append(json.dumps(chosen, ensure_ascii=False))
-
     filename = f"export_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.jsonl"
-    return PlainTextResponse(
-        "\n".join(records),
+    return StreamingResponse(
+        chain([first], (f"\n{line}" for line in lines)),
         media_type="application/x-jsonlines",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -1498,34 +1658,29 @@ def get_annotation_diffs(
     db: Session = Depends(get_db),
     _: str = Depends(get_current_user),
 ):
-    annotations = db.query(Annotation).filter(Annotation.text_id == text_id).all()
-    if not annotations:
+    rows = db.execute(
+        select(
+            Annotation.author_id,
+            Annotation.start_token,
+            Annotation.end_token,
+            Annotation.replacement,
+            Annotation.error_type_id,
+        )
+        .where(Annotation.text_id == text_id)
+        .order_by(Annotation.id)
+    ).all()
+    if not rows:
         return TextDiffResponse(text_id=text_id, pairs=[])
 
-    grouped: dict[str, list[Annotation]] = {}
-    for annotation in annotations:
-        grouped.setdefault(str(annotation.author_id), []).append(annotation)
+    # Each author's edit set is built once and reused for every pair it takes part in.
+    author_sets: dict[str, set[tuple]] = {}
+    for author_id, *signature in rows:
+        author_sets.setdefault(str(author_id), set()).add(tuple(signature))
 
     diffs = []
-    for left_id, right_id in combinations(grouped.keys(), 2):
-        left_set = {
-            (
-                ann.start_token,
-                ann.end_token,
-                ann.replacement,
-                ann.error_type_id,
-            )
-            for ann in grouped[left_id]
-        }
-        right_set = {
-            (
-                ann.start_token,
-                ann.end_token,
-                ann.replacement,
-                ann.error_type_id,
-            )
-            for ann in grouped[right_id]
-        }
+    for left_id, right_id in combinations(author_sets, 2):
+        left_set = author_sets[left_id]
+        right_set = author_sets[right_id]
         diffs.append(
             {
                 "pair": [left_id, right_id],
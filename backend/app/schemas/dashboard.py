@@ -44,11 +44,15 @@ class TaskEntry(BaseModel):
 class PaginatedFlagged(BaseModel):
     items: list[FlaggedEntry]
     next_offset: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
 
 
 class PaginatedTasks(BaseModel):
     items: list[TaskEntry]
     next_offset: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
 
 
 class DashboardStats(BaseModel):
@@ -16,9 +16,13 @@ from ..config import get_settings
 from ..database import SessionLocal
 from ..models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 settings = get_settings()
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.security.bcrypt_rounds
+)
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
+# Settings are fixed for the life of the process, so the default token lifetime is too.
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.security.access_token_expire_minutes)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -30,9 +34,7 @@ def get_password_hash(password: str) -> str:
 
 
 def create_access_token(subject: UUID, expires_delta: Optional[timedelta] = None) -> str:
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=settings.security.access_token_expire_minutes)
-    )
+    expire = datetime.now(timezone.utc) + (expires_delta or ACCESS_TOKEN_EXPIRES)
     to_encode = {"sub": str(subject), "exp": expire}
     return jwt.encode(to_encode, settings.security.secret_key, algorithm=settings.security.algorithm)
 
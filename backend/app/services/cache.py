@@ -0,0 +1,66 @@
+"""
+Small in-process TTL cache for read-mostly endpoint results.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after they are stored.
+
+    ``clear`` bumps a generation counter so a value computed concurrently with an
+    invalidation is never written back as fresh.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, *, generation: int | None = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        generation = self._generation
+        value = factory()
+        self.set(key, value, generation=generation)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        if len(self._entries) >= self.maxsize:
+            del self._entries[min(self._entries, key=lambda key: self._entries[key][0])]
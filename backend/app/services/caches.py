@@ -0,0 +1,42 @@
+"""
+Shared endpoint result caches and the invalidation hooks writers call after committing.
+"""
+
+from .cache import TTLCache
+
+# The category list aggregates over every text and task; dashboards poll it, so serve a
+# short-lived snapshot.
+category_list_cache = TTLCache(ttl=15, maxsize=32)
+
+
+def invalidate_category_stats() -> None:
+    """Drop the cached category list after categories or texts are created or changed."""
+    category_list_cache.clear()
+
+
+# Every open dashboard polls /stats; a few seconds of staleness lets them share one query.
+dashboard_stats_cache = TTLCache(ttl=5, maxsize=1)
+
+
+def invalidate_dashboard_stats() -> None:
+    """Drop the cached stats after texts, tasks, or flags change."""
+    dashboard_stats_cache.clear()
+
+
+# The annotator filter list is loaded with every dashboard view but rarely changes.
+annotators_cache = TTLCache(ttl=60, maxsize=1)
+
+
+def invalidate_annotators() -> None:
+    """Drop the cached annotator list after users are created or renamed."""
+    annotators_cache.clear()
+
+
+# The error type palette is loaded on every annotation page but edited rarely; entries are
+# keyed by include_inactive.
+error_type_list_cache = TTLCache(ttl=300, maxsize=2)
+
+
+def invalidate_error_types() -> None:
+    """Drop the cached error type lists after an error type is created or changed."""
+    error_type_list_cache.clear()
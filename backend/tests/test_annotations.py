@@ -278,6 +278,48 @@ def test_annotation_versions_snapshot_created(client):
         assert snapshot["payload"]["operation"] == "replace"
 
 
+def test_save_annotations_mixes_new_and_updated_in_request_order(client):
+    text_id, et_id = get_seed_ids()
+    with db.SessionLocal() as session:
+        ann = Annotation(
+            text_id=text_id,
+            author_id=TEST_USER_ID,
+            start_token=1,
+            end_token=1,
+            replacement="old",
+            payload={"operation": "replace", "before_tokens": ["base-1"], "after_tokens": []},
+            error_type_id=et_id,
+        )
+        session.add(ann)
+        session.commit()
+        ann_id = ann.id
+
+    def item(start: int, text: str) -> dict:
+        return {
+            "start_token": start,
+            "end_token": start,
+            "replacement": text,
+            "error_type_id": et_id,
+            "payload": {
+                "operation": "replace",
+                "before_tokens": [f"base-{start}"],
+                "after_tokens": [{"id": f"base-{start}", "text": text, "origin": "base"}],
+                "text_sha256": sha256("hello world"),
+            },
+        }
+
+    payload = {"annotations": [item(0, "a"), item(1, "b"), item(2, "c")], "client_version": 1}
+    resp = client.post(f"/api/texts/{text_id}/annotations", json=payload)
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert [ann["replacement"] for ann in data] == ["a", "b", "c"]
+    assert [ann["version"] for ann in data] == [1, 2, 1]
+    assert data[1]["id"] == ann_id
+    with db.SessionLocal() as session:
+        versions = session.query(AnnotationVersion).order_by(AnnotationVersion.id).all()
+        assert [(v.annotation_id, v.version) for v in versions] == [(ann["id"], ann["version"]) for ann in data]
+
+
 def test_save_annotations_rejects_stale_version(client):
     text_id, et_id = get_seed_ids()
     with db.SessionLocal() as session:
@@ -1115,3 +1157,42 @@ def test_save_annotations_populates_token_snapshot_when_missing(client):
     data = resp.json()[0]
     assert data["payload"]["text_tokens"] == ["hello", "world"]
     assert data["payload"]["text_tokens_sha256"]
+
+
+def test_annotation_diffs_compare_each_author_pair(client):
+    text_id, et_id = get_seed_ids()
+    other_ids = [uuid.uuid4(), uuid.uuid4()]
+    with db.SessionLocal() as session:
+        for index, user_id in enumerate(other_ids):
+            session.add(User(id=user_id, username=f"peer{index}", password_hash="x", role="annotator"))
+        session.flush()
+        edits = {
+            TEST_USER_ID: [(0, 0, "hi"), (1, 1, "there")],
+            other_ids[0]: [(0, 0, "hi")],
+            other_ids[1]: [(0, 0, "hey")],
+        }
+        for author_id, author_edits in edits.items():
+            for start, end, replacement in author_edits:
+                session.add(
+                    Annotation(
+                        text_id=text_id,
+                        author_id=author_id,
+                        start_token=start,
+                        end_token=end,
+                        replacement=replacement,
+                        error_type_id=et_id,
+                        payload={},
+                    )
+                )
+        session.commit()
+
+    resp = client.get(f"/api/texts/{text_id}/diffs")
+    assert resp.status_code == 200, resp.text
+    pairs = {tuple(pair["pair"]): pair for pair in resp.json()["pairs"]}
+    assert len(pairs) == 3
+    agreeing = pairs[(str(TEST_USER_ID), str(other_ids[0]))]
+    assert agreeing["only_right"] == []
+    assert [diff[2] for diff in agreeing["only_left"]] == ["there"]
+    disagreeing = pairs[(str(other_ids[0]), str(other_ids[1]))]
+    assert [diff[2] for diff in disagreeing["only_left"]] == ["hi"]
+    assert [diff[2] for diff in disagreeing["only_right"]] == ["hey"]
@@ -12,6 +12,7 @@ import app.database as db
 from app.main import app
 from app.models import AnnotationTask, Base, Category, TextSample, User
 from app.services.auth import get_current_user, get_db
+from app.services.caches import invalidate_category_stats
 
 
 def override_get_db():
@@ -38,6 +39,7 @@ def override_get_current_user():
 @pytest.fixture(autouse=True)
 def setup_db():
     db.configure_engine("sqlite:///:memory:")
+    invalidate_category_stats()
     Base.metadata.drop_all(
         bind=db.engine,
         tables=[User.__table__, Category.__table__, TextSample.__table__, AnnotationTask.__table__],
@@ -89,6 +91,34 @@ def test_categories_order_by_created_desc_and_include_hidden_flag(client):
     assert data[1]["is_hidden"] is False
 
 
+def test_create_category_returns_defaults_without_texts(client):
+    resp = client.post("/api/categories/", json={"name": "Fresh", "description": "d"})
+    assert resp.status_code == 201, resp.text
+    data = resp.json()
+    assert data["name"] == "Fresh"
+    assert data["is_hidden"] is False
+    assert data["created_at"] is not None
+    assert data["total_texts"] == 0
+    assert data["remaining_texts"] == 0
+
+    listed = client.get("/api/categories/").json()
+    assert [c["id"] for c in listed] == [data["id"]]
+
+
+def test_category_list_is_cached_until_mutation(client):
+    assert client.get("/api/categories/").json() == []
+
+    with db.SessionLocal() as session:
+        session.add(Category(name="Direct", description=None))
+        session.commit()
+    assert client.get("/api/categories/").json() == []
+
+    resp = client.post("/api/categories/", json={"name": "ViaApi"})
+    assert resp.status_code == 201, resp.text
+    listed = client.get("/api/categories/").json()
+    assert sorted(c["name"] for c in listed) == ["Direct", "ViaApi"]
+
+
 def test_update_category_hides_and_unhides(client):
     with db.SessionLocal() as session:
         cat = Category(name="Demo", description=None)
@@ -1,13 +1,19 @@
+import json
 import os
+import uuid
 from types import SimpleNamespace
 
 import pytest
+import typer
 from sqlalchemy.engine import make_url
 
 os.environ.setdefault("DATABASE__URL", "sqlite:///:memory:")
 os.environ.setdefault("SKIP_CREATE_ALL", "1")
 
 import app.cli as cli_module
+import app.database as db
+from app.models import Annotation, Base, Category, TextSample, User
+from app.services.auth import verify_password
 
 
 def test_configure_cli_uses_database_url_override(monkeypatch: pytest.MonkeyPatch):
@@ -64,3 +70,152 @@ def test_configure_cli_does_nothing_without_overrides(monkeypatch: pytest.Monkey
     )
 
     assert called == []
+
+
+TEXT_TABLES = [Category.__table__, TextSample.__table__]
+ANNOTATION_TABLES = [Annotation.__table__]
+USER_TABLES = [User.__table__]
+
+
+@pytest.fixture
+def tables(request):
+    """Fresh in-memory database holding only the tables a CLI command touches."""
+    db.configure_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=db.engine, tables=request.param)
+    yield request.param
+    Base.metadata.drop_all(bind=db.engine, tables=request.param)
+
+
+@pytest.mark.parametrize("tables", [TEXT_TABLES], indirect=True)
+def test_import_texts_bulk_inserts_content(tables, tmp_path):
+    source = tmp_path / "texts.json"
+    source.write_text(
+        json.dumps({"category": "Imported", "required_annotations": 3, "content": ["a", "b"]})
+    )
+
+    cli_module.import_texts(source)
+
+    with db.session_scope() as session:
+        category_id = session.query(Category.id).filter(Category.name == "Imported").scalar()
+        rows = session.query(
+            TextSample.content, TextSample.category_id, TextSample.required_annotations
+        ).order_by(TextSample.id).all()
+    assert [tuple(row) for row in rows] == [("a", category_id, 3), ("b", category_id, 3)]
+
+
+@pytest.mark.parametrize("tables", [TEXT_TABLES], indirect=True)
+def test_import_texts_inserts_in_batches(tables, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cli_module, "IMPORT_BATCH_SIZE", 2)
+    source = tmp_path / "texts.json"
+    source.write_text(
+        json.dumps({"category": "Batched", "content": ["one", "два", "three", "four", "five"]}),
+        encoding="utf-8",
+    )
+
+    cli_module.import_texts(source)
+
+    with db.session_scope() as session:
+        contents = [row.content for row in session.query(TextSample.content).order_by(TextSample.id)]
+    assert contents == ["one", "два", "three", "four", "five"]
+
+
+@pytest.mark.parametrize("tables", [TEXT_TABLES], indirect=True)
+def test_import_texts_stores_tokens_cache(tables, tmp_path):
+    source = tmp_path / "texts.json"
+    source.write_text(
+        json.dumps({"category": "Cached", "content": ["Сәлам дөнья\nяңа юл"]}), encoding="utf-8"
+    )
+
+    cli_module.import_texts(source)
+
+    with db.session_scope() as session:
+        tokens_cache = session.query(TextSample.tokens_cache).scalar()
+    assert tokens_cache is not None
+    assert [token["text"] for token in tokens_cache["tokens"]] == ["Сәлам", "дөнья", "яңа", "юл"]
+    assert tokens_cache["line_breaks"] == [2]
+
+
+@pytest.mark.parametrize("tables", [ANNOTATION_TABLES], indirect=True)
+def test_export_annotations_streams_json_array(tables, tmp_path):
+    author_id = uuid.uuid4()
+    with db.session_scope() as session:
+        session.add_all(
+            [
+                Annotation(
+                    text_id=2,
+                    author_id=author_id,
+                    start_token=0,
+                    end_token=1,
+                    replacement="ә",
+                    error_type_id=1,
+                    payload={"note": "x"},
+                ),
+                Annotation(
+                    text_id=1,
+                    author_id=author_id,
+                    start_token=3,
+                    end_token=3,
+                    replacement=None,
+                    error_type_id=2,
+                    payload={},
+                ),
+            ]
+        )
+    output = tmp_path / "annotations.json"
+
+    cli_module.export_annotations(output)
+
+    exported = json.loads(output.read_text(encoding="utf-8"))
+    assert [item["text_id"] for item in exported] == [1, 2]
+    assert exported[1]["replacement"] == "ә"
+    assert exported[1]["payload"] == {"note": "x"}
+    assert exported[0]["author_id"] == str(author_id)
+
+
+@pytest.mark.parametrize("tables", [ANNOTATION_TABLES], indirect=True)
+def test_export_annotations_writes_empty_array(tables, tmp_path):
+    output = tmp_path / "annotations.json"
+
+    cli_module.export_annotations(output)
+
+    assert json.loads(output.read_text(encoding="utf-8")) == []
+
+
+@pytest.mark.parametrize("tables", [USER_TABLES], indirect=True)
+def test_import_users_hashes_passwords_and_inserts_rows(tables, tmp_path):
+    source = tmp_path / "users.json"
+    source.write_text(
+        json.dumps(
+            [
+                {"username": "alice", "password": "pw-a", "full_name": "Alice"},
+                {"username": "bob", "password": "pw-b", "role": "admin"},
+            ]
+        )
+    )
+
+    cli_module.import_users(source)
+
+    with db.session_scope() as session:
+        users = {
+            user.username: (user.role, user.full_name, user.password_hash)
+            for user in session.query(User).all()
+        }
+    assert set(users) == {"alice", "bob"}
+    assert users["alice"][:2] == ("annotator", "Alice")
+    assert users["bob"][:2] == ("admin", None)
+    assert verify_password("pw-a", users["alice"][2])
+    assert verify_password("pw-b", users["bob"][2])
+
+
+@pytest.mark.parametrize("tables", [USER_TABLES], indirect=True)
+def test_import_users_rejects_existing_usernames(tables, tmp_path):
+    with db.session_scope() as session:
+        session.add(User(username="alice", password_hash="x"))
+    source = tmp_path / "users.json"
+    source.write_text(json.dumps([{"username": "alice", "password": "pw"}]))
+
+    with pytest.raises(typer.Exit):
+        cli_module.import_users(source)
+
+    with db.session_scope() as session:
+        assert session.query(User).count() == 1
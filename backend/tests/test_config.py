@@ -53,3 +53,9 @@ def test_get_settings_is_cached_until_cache_clear(monkeypatch: pytest.MonkeyPatc
     get_settings.cache_clear()
     refreshed = get_settings()
     assert refreshed.security.secret_key == "second-secret"
+
+
+def test_get_settings_reads_bcrypt_rounds(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SECURITY__BCRYPT_ROUNDS", "4")
+
+    assert get_settings().security.bcrypt_rounds == 4
@@ -21,6 +21,7 @@ from app.models import (
     User,
 )
 from app.services.auth import get_current_user, get_db
+from app.services.caches import invalidate_annotators, invalidate_dashboard_stats
 
 
 def override_get_db():
@@ -47,6 +48,8 @@ def override_get_current_user():
 @pytest.fixture(autouse=True)
 def setup_db():
     db.configure_engine("sqlite:///:memory:")
+    invalidate_dashboard_stats()
+    invalidate_annotators()
     tables = [
         User.__table__,
         Category.__table__,
@@ -149,3 +152,152 @@ def test_dashboard_activity_shows_recent_submission(client):
     assert resp.status_code == 200, resp.text
     data = resp.json()
     assert any(item["text_id"] == text_id for item in data.get("items", []))
+
+
+def _collect_pages(client, path, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, limit=1)
+        if cursor:
+            query["cursor"] = cursor
+        resp = client.get(path, params=query)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        ids.extend(item.get("task_id", item.get("id")) for item in data["items"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids, pages
+        assert data["next_offset"] is None or pages == 1
+
+
+@pytest.mark.parametrize("order", ["desc", "asc"])
+@pytest.mark.parametrize("sort", ["updated_at", "category", "text"])
+def test_dashboard_history_cursor_walks_every_row_once(client, sort, order):
+    full = client.get("/api/dashboard/history", params={"limit": 50, "sort": sort, "order": order}).json()
+    expected = [item["task_id"] for item in full["items"]]
+    assert full["next_cursor"] is None
+
+    ids, pages = _collect_pages(client, "/api/dashboard/history", sort=sort, order=order)
+
+    assert ids == expected
+    assert pages == len(expected)
+
+
+def test_dashboard_flagged_cursor_and_legacy_offset(client):
+    with db.SessionLocal() as session:
+        text_id = session.query(TextSample.id).filter(TextSample.content == "text submitted").scalar()
+        session.add(SkippedText(text_id=text_id, annotator_id=TEST_USER_ID, flag_type="skip"))
+        session.flush()
+        # SQLite's CURRENT_TIMESTAMP default drops microseconds; store comparable values.
+        session.query(SkippedText).update({SkippedText.created_at: datetime.now(timezone.utc)})
+        session.commit()
+
+    first = client.get("/api/dashboard/flagged", params={"limit": 1}).json()
+    assert first["next_offset"] == 1
+    second = client.get("/api/dashboard/flagged", params={"limit": 1, "cursor": first["next_cursor"]}).json()
+    by_offset = client.get("/api/dashboard/flagged", params={"limit": 1, "offset": 1}).json()
+
+    assert [item["id"] for item in second["items"]] == [item["id"] for item in by_offset["items"]]
+    assert second["next_cursor"] is None
+    assert first["items"][0]["id"] != second["items"][0]["id"]
+
+
+def test_dashboard_rejects_malformed_cursor(client):
+    resp = client.get("/api/dashboard/submitted", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+def test_dashboard_stats_counts(client):
+    resp = client.get("/api/dashboard/stats")
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["total_texts"] == 3
+    assert data["pending_texts"] == 0
+    assert data["awaiting_review_texts"] == 1
+    assert data["completed_texts"] == 1
+    assert data["submitted_tasks"] == 1
+    assert data["skipped_count"] == 1
+    assert data["trashed_count"] == 1
+
+
+def test_dashboard_stats_cached_until_invalidated(client):
+    assert client.get("/api/dashboard/stats").json()["skipped_count"] == 1
+
+    with db.SessionLocal() as session:
+        text_id = session.query(TextSample.id).filter(TextSample.content == "text submitted").scalar()
+        session.add(SkippedText(text_id=text_id, annotator_id=TEST_USER_ID, flag_type="skip"))
+        session.commit()
+    assert client.get("/api/dashboard/stats").json()["skipped_count"] == 1
+
+    invalidate_dashboard_stats()
+    assert client.get("/api/dashboard/stats").json()["skipped_count"] == 2
+
+
+@pytest.mark.parametrize("sort", ["occurred_at", "category", "annotator", "text"])
+def test_dashboard_activity_offset_pages_match_full_listing(client, sort):
+    full = client.get("/api/dashboard/activity", params={"limit": 50, "sort": sort}).json()
+    expected = [(item["kind"], item["id"]) for item in full["items"]]
+    assert len(expected) == 5
+    assert full["next_offset"] is None
+
+    seen, offset = [], 0
+    while offset is not None:
+        data = client.get("/api/dashboard/activity", params={"limit": 2, "offset": offset, "sort": sort}).json()
+        seen.extend((item["kind"], item["id"]) for item in data["items"])
+        offset = data["next_offset"]
+
+    assert seen == expected
+
+
+def test_dashboard_id_filters_accept_csv_and_repeated_params(client):
+    with db.SessionLocal() as session:
+        other_id = session.query(User.id).filter(User.username == "other").scalar()
+        category_id = session.query(Category.id).scalar()
+
+    csv = client.get(
+        "/api/dashboard/history",
+        params={"category_ids": f"{category_id},999", "annotator_ids": str(other_id)},
+    )
+    repeated = client.get(
+        "/api/dashboard/history",
+        params=[("category_ids", str(category_id)), ("category_ids", "999"), ("annotator_ids", str(other_id))],
+    )
+    assert csv.status_code == repeated.status_code == 200
+    assert len(csv.json()["items"]) == 3
+    assert csv.json() == repeated.json()
+
+    none_match = client.get("/api/dashboard/history", params={"annotator_ids": str(uuid.uuid4())})
+    assert none_match.json()["items"] == []
+
+    assert client.get("/api/dashboard/history", params={"category_ids": "1,abc"}).status_code == 422
+
+
+def test_dashboard_annotators_sorted_and_cached(client):
+    first = client.get("/api/dashboard/annotators").json()
+    assert [item["username"] for item in first] == ["dashboarder", "other"]
+
+    with db.SessionLocal() as session:
+        session.add(User(id=uuid.uuid4(), username="aaa", full_name="Zed", password_hash="x"))
+        session.commit()
+    assert client.get("/api/dashboard/annotators").json() == first
+
+    invalidate_annotators()
+    refreshed = client.get("/api/dashboard/annotators").json()
+    assert [item["username"] for item in refreshed] == ["aaa", "dashboarder", "other"]
+
+
+def test_dashboard_history_include_total(client):
+    first = client.get("/api/dashboard/history", params={"limit": 1, "include_total": True}).json()
+    assert first["total"] == 3
+    assert len(first["items"]) == 1
+
+    by_offset = client.get("/api/dashboard/history", params={"limit": 1, "offset": 2, "include_total": True}).json()
+    assert by_offset["total"] == 3
+
+    by_cursor = client.get(
+        "/api/dashboard/history",
+        params={"limit": 1, "cursor": first["next_cursor"], "include_total": True},
+    ).json()
+    assert by_cursor["total"] is None
+    assert client.get("/api/dashboard/history", params={"limit": 1}).json()["total"] is None
@@ -11,6 +11,7 @@ import app.database as db
 from app.main import app
 from app.models import Base, ErrorType, User, UserErrorType
 from app.services.auth import get_current_user, get_db
+from app.services.caches import invalidate_error_types
 
 
 def override_get_db():
@@ -38,6 +39,7 @@ def override_get_current_user():
 def setup_db():
     # In-memory SQLite for fast tests; create only needed tables.
     db.configure_engine("sqlite:///:memory:")
+    invalidate_error_types()
     Base.metadata.drop_all(
         bind=db.engine,
         tables=[User.__table__, ErrorType.__table__, UserErrorType.__table__],
@@ -120,6 +122,26 @@ def test_list_error_types_filters_inactive_and_orders(client):
     assert [et["en_name"] for et in resp_all.json()] == ["A", "B", "Z"]
 
 
+def test_error_type_list_is_cached_until_mutation(client):
+    assert client.get("/api/error-types/").json() == []
+
+    with db.SessionLocal() as session:
+        session.add(ErrorType(en_name="Direct", category_en="Grammar", sort_order=1, is_active=True))
+        session.commit()
+    assert client.get("/api/error-types/").json() == []
+    assert [et["en_name"] for et in client.get("/api/error-types/?include_inactive=true").json()] == [
+        "Direct"
+    ]
+
+    created = client.post("/api/error-types/", json={"en_name": "ViaApi", "category_en": "Grammar"})
+    assert created.status_code == 201, created.text
+    assert [et["en_name"] for et in client.get("/api/error-types/").json()] == ["Direct", "ViaApi"]
+
+    resp = client.put(f"/api/error-types/{created.json()['id']}", json={"is_active": False})
+    assert resp.status_code == 200, resp.text
+    assert [et["en_name"] for et in client.get("/api/error-types/").json()] == ["Direct"]
+
+
 def test_create_error_type_assigns_sort_order(client):
     with db.SessionLocal() as session:
         session.add_all(
@@ -300,3 +322,10 @@ def test_upsert_preferences_creates_and_updates(client):
     assert updated["color"] == "#abcdef"
     assert updated["hotkey"] == "shift+w"
     assert updated["custom_name"] is None
+
+
+def test_upsert_preferences_for_missing_error_type_returns_404(client):
+    resp = client.put("/api/error-types/9999/preferences", json={"color": "#123456"})
+    assert resp.status_code == 404
+    with db.SessionLocal() as session:
+        assert session.query(UserErrorType).count() == 0
@@ -23,6 +23,7 @@ from app.models import (
     User,
     CrossValidationResult,
 )
+from app.routers import texts
 from app.services.auth import get_current_user, get_db
 
 
@@ -219,6 +220,9 @@ def test_export_single_text_picks_latest_variant(client):
     record = json.loads(resp.text.strip())
     assert record["target"] == "alpha BETA"
 
+    bulk_records = [item for item in parse_jsonl(client.get("/api/texts/export").text) if item["id"] == text_id]
+    assert [item["target"] for item in bulk_records] == ["alpha BETA"]
+
 
 def test_export_includes_noop_when_no_annotations(client):
     with db.SessionLocal() as session:
@@ -242,6 +246,25 @@ def test_export_includes_noop_when_no_annotations(client):
     assert record["target"] == "plain sample"
 
 
+def test_export_streams_in_batches(client, monkeypatch):
+    monkeypatch.setattr(texts, "EXPORT_BATCH_SIZE", 1)
+    with db.SessionLocal() as session:
+        category = session.query(Category).filter_by(name="ExportCat").one()
+        for content in ("first batch", "second batch"):
+            text = TextSample(content=content, category_id=category.id, required_annotations=1)
+            session.add(text)
+            session.flush()
+            session.add(AnnotationTask(text_id=text.id, annotator_id=TEST_USER_ID, status="submitted"))
+        session.commit()
+
+    resp = client.get("/api/texts/export")
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-disposition"].startswith("attachment;")
+    assert not resp.text.endswith("\n")
+    records = parse_jsonl(resp.text)
+    assert sorted(record["target"] for record in records) == ["first batch", "hi world", "second batch"]
+
+
 def test_export_filters_by_category(client):
     resp = client.get("/api/texts/export", params={"category_ids": "999"})
     assert resp.status_code == 200, resp.text
@@ -440,6 +463,41 @@ def test_render_endpoint_returns_corrected_text(client):
     assert body["corrected_text"] == "hi world"
 
 
+def test_render_endpoint_reuses_result_for_identical_requests(client, monkeypatch):
+    with db.SessionLocal() as session:
+        text_id = session.query(TextSample).filter_by(content="hello world").one().id
+    calls = []
+    original = texts._render_corrected_text
+    monkeypatch.setattr(texts, "_render_cache", texts.TTLCache(ttl=60))
+    monkeypatch.setattr(
+        texts, "_render_corrected_text", lambda source, anns: calls.append(source) or original(source, anns)
+    )
+    payload = {
+        "annotations": [
+            {
+                "start_token": 1,
+                "end_token": 1,
+                "replacement": "there",
+                "payload": {
+                    "operation": "replace",
+                    "before_tokens": ["world"],
+                    "after_tokens": [{"id": "a1", "text": "there", "origin": "base"}],
+                },
+            }
+        ]
+    }
+
+    first = client.post(f"/api/texts/{text_id}/render", json=payload)
+    second = client.post(f"/api/texts/{text_id}/render", json=payload)
+    assert first.json() == second.json() == {"corrected_text": "hello there"}
+    assert len(calls) == 1
+
+    payload["annotations"][0]["replacement"] = "you"
+    payload["annotations"][0]["payload"]["after_tokens"][0]["text"] = "you"
+    assert client.post(f"/api/texts/{text_id}/render", json=payload).json()["corrected_text"] == "hello you"
+    assert len(calls) == 2
+
+
 def test_import_export_round_trip_preserves_blocks(client):
     with db.SessionLocal() as session:
         category = session.query(Category).filter_by(name="ExportCat").one()
@@ -485,3 +543,100 @@ def test_import_export_round_trip_preserves_blocks(client):
     record = next(item for item in records if item["source"].startswith("Rainy day"))
     assert record["edits"]
     assert any(edit["error_type"] == "PUNC" for edit in record["edits"])
+
+
+def test_import_stores_tokens_cache_used_by_export(client, monkeypatch):
+    with db.SessionLocal() as session:
+        cat_id = session.query(Category).filter_by(name="ExportCat").one().id
+        error_type_id = session.query(ErrorType).first().id
+
+    resp = client.post(
+        "/api/texts/import",
+        json={
+            "category_id": cat_id,
+            "required_annotations": 1,
+            "texts": [
+                {
+                    "text": "Cloudy day\nwarm night",
+                    "annotations": [
+                        {
+                            "start_token": 0,
+                            "end_token": 0,
+                            "replacement": "Clear",
+                            "error_type_id": error_type_id,
+                            "payload": {
+                                "operation": "replace",
+                                "after_tokens": [{"id": "a1", "text": "Clear", "origin": "base"}],
+                            },
+                        }
+                    ],
+                }
+            ],
+        },
+    )
+    assert resp.status_code == 201, resp.text
+    with db.SessionLocal() as session:
+        text = session.query(TextSample).filter_by(content="Cloudy day\nwarm night").one()
+        assert text.tokens_cache["line_breaks"] == [2]
+        assert [token["text"] for token in text.tokens_cache["tokens"]] == ["Cloudy", "day", "warm", "night"]
+
+    def fail_tokenize(_text):
+        raise AssertionError("export re-tokenized an imported text")
+
+    monkeypatch.setattr(texts, "_tokenize_to_tokens", fail_tokenize)
+    monkeypatch.setattr(texts, "_compute_line_breaks", fail_tokenize)
+    with db.SessionLocal() as session:
+        # Legacy texts without a cache would still need tokenizing; keep only the imported one.
+        session.query(TextSample).filter(TextSample.tokens_cache.is_(None)).update(
+            {TextSample.state: "trash"}, synchronize_session=False
+        )
+        session.commit()
+
+    export_resp = client.get("/api/texts/export")
+    assert export_resp.status_code == 200, export_resp.text
+    records = parse_jsonl(export_resp.text)
+    assert [record["target"] for record in records] == ["Clear day\nwarm night"]
+
+
+def test_tokenizer_splits_special_tokens_from_trailing_punctuation():
+    tokens = texts._tokenize_to_tokens("Write to a.b@mail.ru or www.example.com/x?. Call +7 (917) 123-45-67!")
+    assert [(token["text"], token["kind"], token["space_before"]) for token in tokens] == [
+        ("Write", "word", False),
+        ("to", "word", True),
+        ("a.b@mail.ru", "special", True),
+        ("or", "word", True),
+        ("www.example.com/x", "special", True),
+        ("?", "punct", False),
+        (".", "punct", False),
+        ("Call", "word", True),
+        ("+7 (917) 123-45-67", "special", True),
+        ("!", "punct", False),
+    ]
+
+
+def test_render_endpoint_tokenizes_each_source_once(client, monkeypatch):
+    with db.SessionLocal() as session:
+        text_id = session.query(TextSample).filter_by(content="hello world").one().id
+    calls = []
+    original = texts._tokenize_to_tokens
+    monkeypatch.setattr(texts, "_tokenize_to_tokens", lambda source: calls.append(source) or original(source))
+    monkeypatch.setattr(texts, "_render_cache", texts.TTLCache(ttl=60))
+    texts._build_tokens_cache.cache_clear()
+
+    for replacement in ("there", "you"):
+        payload = {
+            "annotations": [
+                {
+                    "start_token": 1,
+                    "end_token": 1,
+                    "replacement": replacement,
+                    "payload": {
+                        "operation": "replace",
+                        "after_tokens": [{"id": "a1", "text": replacement, "origin": "base"}],
+                    },
+                }
+            ]
+        }
+        resp = client.post(f"/api/texts/{text_id}/render", json=payload)
+        assert resp.json() == {"corrected_text": f"hello {replacement}"}
+    assert calls.count("hello world") == 2  # tokens and line breaks of the first render only
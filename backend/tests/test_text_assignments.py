@@ -26,6 +26,7 @@ from app.models import (
 )
 from app.routers.texts import LOCK_DURATION
 from app.services.auth import get_current_user, get_db
+from app.services.caches import invalidate_error_types
 
 
 def override_get_db():
@@ -374,6 +375,31 @@ def test_list_annotations_all_authors(client):
     assert data[0]["author_id"] != str(TEST_USER_ID)
 
 
+def test_reflagging_updates_reason_and_switches_flag_type(client):
+    with db.SessionLocal() as session:
+        text = session.query(TextSample).filter_by(content="text B").one()
+        text.locked_by_id = TEST_USER_ID
+        text.locked_at = datetime.now(timezone.utc)
+        session.commit()
+        text_id = text.id
+
+    assert client.post(f"/api/texts/{text_id}/skip", json={"reason": "later"}).status_code == 204
+    assert client.post(f"/api/texts/{text_id}/skip", json={"reason": "unclear"}).status_code == 204
+    with db.SessionLocal() as session:
+        flags = session.query(SkippedText).filter_by(text_id=text_id, annotator_id=TEST_USER_ID).all()
+        assert [(flag.flag_type, flag.reason) for flag in flags] == [("skip", "unclear")]
+        text_row = session.get(TextSample, text_id)
+        assert (text_row.state, text_row.locked_by_id, text_row.locked_at) == ("skipped", None, None)
+
+    assert client.post(f"/api/texts/{text_id}/trash", json={"reason": "spam"}).status_code == 204
+    with db.SessionLocal() as session:
+        flags = session.query(SkippedText).filter_by(text_id=text_id, annotator_id=TEST_USER_ID).all()
+        assert [(flag.flag_type, flag.reason) for flag in flags] == [("trash", "spam")]
+        assert session.get(TextSample, text_id).state == "trash"
+
+    assert client.post("/api/texts/999999/skip", json={"reason": "x"}).status_code == 404
+
+
 def test_submission_clears_flags_for_exclusive_state(client):
     with db.SessionLocal() as session:
         text = session.query(TextSample).filter_by(content="text B").one()
@@ -480,6 +506,40 @@ def test_submit_creates_assignment_and_noop_when_missing(client):
         assert cv is not None
 
 
+def test_submit_creating_noop_type_refreshes_error_type_list(client):
+    invalidate_error_types()
+    assert [et["en_name"] for et in client.get("/api/error-types/").json()] == ["OTHER"]
+    with db.SessionLocal() as session:
+        text_id = session.query(TextSample).filter_by(content="text B").one().id
+
+    assert client.post(f"/api/texts/{text_id}/submit").status_code == 202
+
+    assert [et["en_name"] for et in client.get("/api/error-types/").json()] == ["OTHER", "noop"]
+
+
+def test_submit_completes_text_once_required_annotations_are_met(client):
+    other_id = uuid.uuid4()
+    with db.SessionLocal() as session:
+        session.add(User(id=other_id, username="other", password_hash="x", role="annotator", is_active=True))
+        text = session.query(TextSample).filter_by(content="text A").one()
+        text_id = text.id
+        session.commit()
+
+    resp = client.post(f"/api/texts/{text_id}/submit")
+    assert resp.status_code == 202, resp.text
+    with db.SessionLocal() as session:
+        assert session.get(TextSample, text_id).state == "pending"
+
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=other_id, username="other", password_hash="x", role="annotator", is_active=True
+    )
+    resp = client.post(f"/api/texts/{text_id}/submit")
+    assert resp.status_code == 202, resp.text
+    with db.SessionLocal() as session:
+        assert session.get(TextSample, text_id).state == "awaiting_cross_validation"
+        assert session.query(CrossValidationResult).filter_by(text_id=text_id).one_or_none() is not None
+
+
 def test_switch_between_skip_and_trash_is_exclusive(client):
     with db.SessionLocal() as session:
         text = session.query(TextSample).filter_by(content="text B").one()
@@ -524,3 +584,26 @@ def test_import_skips_duplicate_plain_strings_by_hash(client):
         contents = {r.content for r in rows}
         assert "repeat me" in contents
         assert "unique" in contents
+
+
+def test_history_returns_truncated_previews_newest_first(client):
+    now = datetime.now(timezone.utc)
+    with db.SessionLocal() as session:
+        long_text = TextSample(content="x" * 500, category_id=1, required_annotations=1)
+        session.add(long_text)
+        session.flush()
+        session.add_all(
+            [
+                AnnotationTask(text_id=1, annotator_id=TEST_USER_ID, status="submitted", updated_at=now - timedelta(hours=1)),
+                AnnotationTask(text_id=long_text.id, annotator_id=TEST_USER_ID, status="in_progress", updated_at=now),
+            ]
+        )
+        session.commit()
+        long_text_id = long_text.id
+
+    resp = client.get("/api/texts/history")
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert [item["text_id"] for item in data] == [long_text_id, 1]
+    assert data[0]["preview"] == "x" * 160
+    assert data[1]["preview"] == "text A"